@@ -0,0 +1,133 @@
+import functools
+import metrics
+import model
+import pickle
+import threading
+import time
+import versions
+
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+# Returned by a backend's get() for keys that are not cached
+MISSING = object()
+
+
+class MemoryBackend:
+    """Size-bounded in-process LRU backend.
+
+    Each worker fills its own copy, but entries are keyed on the household
+    change version stored in Postgres, so a write is seen by every worker
+    on its next read.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISSING
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return MISSING
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class RedisBackend:
+    """Redis backend shared by every worker; requires the redis package.
+
+    Eviction is left to Redis (configure maxmemory-policy allkeys-lru).
+    """
+
+    def __init__(self, url: str):
+        import redis
+
+        self._client = redis.Redis.from_url(url)
+
+    def get(self, key: str) -> Any:
+        data = self._client.get(key)
+        return MISSING if data is None else pickle.loads(data)
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        self._client.set(key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), ex=ttl)
+
+
+class CacheStats:
+    """Hit and miss counters per cached namespace."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits: dict[str, int] = {}
+        self.misses: dict[str, int] = {}
+
+    def record(self, namespace: str, hit: bool) -> None:
+        counts = self.hits if hit else self.misses
+        with self._lock:
+            counts[namespace] = counts.get(namespace, 0) + 1
+
+
+stats = CacheStats()
+_backend: Optional[Any] = None
+
+
+def backend() -> Any:
+    """Get the backend selected by READ_CACHE_BACKEND, creating it on first use."""
+    global _backend
+    if _backend is None:
+        match model.app.config['READ_CACHE_BACKEND']:
+            case 'redis':
+                _backend = RedisBackend(model.app.config['READ_CACHE_URL'])
+            case _:
+                _backend = MemoryBackend(model.app.config['READ_CACHE_MAX_ENTRIES'])
+    return _backend
+
+
+def household_cached(namespace: str) -> Callable:
+    """Cache a function of household_uuid until the household changes.
+
+    The household's change version (versions.token) is part of the cache
+    key, so versions.bump() in a write's transaction invalidates every
+    cached entry for that household, in every worker, once it commits,
+    without having to find or delete them.
+
+    Args:
+        namespace: Name of the cached read, used in keys and metrics
+    """
+    def decorator(func: Callable[[str], Any]) -> Callable[[str], Any]:
+        @functools.wraps(func)
+        def wrapper(household_uuid: str) -> Any:
+            store = backend()
+            key = f'{namespace}:{household_uuid}:{versions.token(household_uuid)}'
+            value = store.get(key)
+            stats.record(namespace, value is not MISSING)
+            metrics.CACHE_REQUESTS.labels(namespace, 'miss' if value is MISSING else 'hit').inc()
+            if value is MISSING:
+                value = func(household_uuid)
+                store.set(key, value, model.app.config['READ_CACHE_TTL'])
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def snapshot() -> dict[str, Any]:
+    """Get hit and miss counts and the hit ratio for each namespace."""
+    namespaces = sorted(set(stats.hits) | set(stats.misses))
+    data = {}
+    for namespace in namespaces:
+        hits, misses = stats.hits.get(namespace, 0), stats.misses.get(namespace, 0)
+        data[namespace] = {'hits': hits, 'misses': misses, 'hit_ratio': round(hits / (hits + misses), 4)}
+    return data
@@ -0,0 +1,65 @@
+import gzip
+import model
+
+from flask import Flask, request
+
+try:
+    import brotli
+except ImportError:  # Optional; responses fall back to gzip
+    brotli = None
+
+# Mimetypes of the views worth compressing; /assets goes out through
+# send_from_directory and is never compressed here
+COMPRESSIBLE = {'application/json', 'text/html', 'text/csv'}
+
+
+def _encoding() -> str | None:
+    """Pick the best encoding the client accepts: br, then gzip."""
+    accepted = request.accept_encodings
+    if brotli is not None and accepted['br']:
+        return 'br'
+    if accepted['gzip']:
+        return 'gzip'
+    return None
+
+
+def _compress(response):
+    """Compress large buffered responses with brotli or gzip.
+
+    Streamed responses (/events/all?stream=1, the export API) and files
+    sent by send_from_directory are left alone.
+    """
+    # A 304 must carry the same Vary as the 200 it revalidates, so set it
+    # before deciding whether this particular response is compressed
+    if response.status_code == 304 or response.mimetype in COMPRESSIBLE:
+        response.vary.add('Accept-Encoding')
+    if (response.status_code != 200 or response.direct_passthrough or response.is_streamed
+            or 'Content-Encoding' in response.headers or response.mimetype not in COMPRESSIBLE):
+        return response
+
+    data = response.get_data()
+    if len(data) < model.app.config['COMPRESS_MIN_SIZE']:
+        return response
+    encoding = _encoding()
+    if encoding is None:
+        return response
+
+    if encoding == 'br':
+        data = brotli.compress(data, quality=model.app.config['COMPRESS_BROTLI_QUALITY'])
+    else:
+        data = gzip.compress(data, compresslevel=model.app.config['COMPRESS_GZIP_LEVEL'])
+    response.set_data(data)
+    response.headers['Content-Encoding'] = encoding
+    return response
+
+
+def init_app(app: Flask) -> None:
+    """Install the response compression hook.
+
+    Must run before other after_request hooks are registered, since Flask
+    runs them in reverse order and compression should see the final body.
+
+    Args:
+        app: Flask application
+    """
+    app.after_request(_compress)
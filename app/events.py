@@ -1,10 +1,23 @@
+import math
+import metrics
 import model
+import rollups
 import uuid
+import versions
 
-from datetime import datetime, timedelta, timezone
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
 from flask import session
-from sqlalchemy import select
-from typing import Any, Optional
+from sqlalchemy import func, insert, select, tuple_
+from typing import Any, ClassVar, Iterator, Optional
+
+# Number of events per /events/all page and per streamed fetch
+PAGE_SIZE = 100
+# Number of events per INSERT batch in bulk_new, and the most accepted per request
+BULK_BATCH_SIZE = 500
+BULK_MAX_EVENTS = 10000
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
 
 
 def _create_event_base(household_uuid: str, created_by: str, event_type: model.EventType, 
@@ -24,7 +37,7 @@ def _create_event_base(household_uuid: str, created_by: str, event_type: model.E
     now = datetime.now(tz=model.APP_TIMEZONE)
     event = model.Event()
     event.household_uuid = household_uuid
-    event.pet_uuid = data.get('pet') if event_type in [model.EventType.Food, model.EventType.Medicine] else None
+    event.pet_uuid = data.get('pet') if event_type in [model.EventType.Food, model.EventType.Medicine, model.EventType.Vitals] else None
     event.timestamp = timestamp or now
     event.type = event_type
     event.created_at = now
@@ -149,69 +162,217 @@ def _create_vitals_event(household_uuid: str, created_by: str, data: dict[str, A
 
 # # # # # # # # # # # # # # # # # # # # #
 
-def all_events() -> list[dict[str, Any]]:
-    """Get all events for the current user's household.
+@dataclass(slots=True)
+class FoodMetaRecord:
+    """Metadata of a Food event."""
+    name: str
+    type: str
+    serving_size: float
+    unit: str
+    calories: int
+
+
+@dataclass(slots=True)
+class MedicineMetaRecord:
+    """Metadata of a Medicine event."""
+    name: str
+    dose: str
+
+
+@dataclass(slots=True)
+class VitalsMetaRecord:
+    """Metadata of a Vitals event."""
+    type: str
+    value: float
+
+
+@dataclass(slots=True)
+class EventRecord:
+    """One event in the household history (events_all.html, /api/events/all)."""
+    # JSON key of each field; the API has always used 'pet-name'/'pet-icon'
+    json_keys: ClassVar[dict[str, str]] = {'id': 'id', 'timestamp': 'timestamp', 'type': 'type',
+                                           'pet_name': 'pet-name', 'pet_icon': 'pet-icon', 'meta': 'meta'}
+    id: int
+    timestamp: datetime
+    type: str
+    pet_name: str
+    pet_icon: str
+    meta: Optional[FoodMetaRecord | MedicineMetaRecord | VitalsMetaRecord]
+
+
+@dataclass(slots=True)
+class SummaryRecord:
+    """Latest event of one type for one pet (events.html, /api/events/summary)."""
+    json_keys: ClassVar[dict[str, str]] = {'type': 'type', 'pet_name': 'pet-name', 'pet_icon': 'pet-icon',
+                                           'time_ago': 'time_ago', 'meta': 'meta'}
+    type: str
+    pet_name: str
+    pet_icon: str
+    time_ago: str
+    meta: Optional[FoodMetaRecord | MedicineMetaRecord | VitalsMetaRecord]
+
+
+# Event list views select only these scalar columns; no ORM objects are built.
+# The typed metadata tables are outer joined, so their uuid is None when absent.
+_EVENT_COLUMNS = (
+    model.Event.id, model.Event.timestamp, model.Event.type, model.Pet.name, model.Pet.photo_addr,
+    model.FoodEvent.uuid, model.FoodEvent.name, model.FoodEvent.type, model.FoodEvent.serving_size,
+    model.FoodEvent.unit, model.FoodEvent.calories,
+    model.MedicineEvent.uuid, model.MedicineEvent.name, model.MedicineEvent.dose,
+    model.VitalsEvent.uuid, model.VitalsEvent.type, model.VitalsEvent.value,
+)
+
+
+def _event_meta(event_type: model.EventType, row: Any) -> Optional[FoodMetaRecord | MedicineMetaRecord | VitalsMetaRecord]:
+    """Get the metadata record for an event from the typed metadata columns of its row.
+
+    Args:
+        event_type: Type of the event
+        row: Row selecting _EVENT_COLUMNS
+
+    Returns:
+        Metadata record, or None if the event type has no metadata
+    """
+    (_, _, _, _, _, food_uuid, food_name, food_type, serving_size, unit, calories,
+     medicine_uuid, medicine_name, dose, vitals_uuid, vitals_type, vitals_value) = row
+    if event_type == model.EventType.Food and food_uuid:
+        return FoodMetaRecord(food_name, food_type.value, serving_size, unit.value, calories)
+    elif event_type == model.EventType.Medicine and medicine_uuid:
+        return MedicineMetaRecord(medicine_name, dose)
+    elif event_type == model.EventType.Vitals and vitals_uuid:
+        return VitalsMetaRecord(vitals_type.name, vitals_value)
+    return None
+
+
+def _event_row(row: Any) -> EventRecord:
+    """Convert a row selecting _EVENT_COLUMNS into the record rendered by events_all.html."""
+    event_id, timestamp, event_type, pet_name, pet_icon = row[:5]
+    return EventRecord(event_id, timestamp, event_type.name, pet_name or '', pet_icon or '',
+                       _event_meta(event_type, row))
+
+
+def _events_query(household_uuid: str):
+    """Build the household event history query, newest first.
+
+    Ordered by (timestamp, id) so it can be paged with a keyset cursor.
+    """
+    return (select(*_EVENT_COLUMNS)
+            .join(model.Pet, isouter=True)
+            .join(model.FoodEvent, isouter=True)
+            .join(model.MedicineEvent, isouter=True)
+            .join(model.VitalsEvent, isouter=True)
+            .where(model.Event.household_uuid == household_uuid)
+            .order_by(model.Event.timestamp.desc(), model.Event.id.desc()))
+
+
+def encode_cursor(event: model.Event | EventRecord) -> str:
+    """Encode an event's (timestamp, id) position as an opaque, URL-safe cursor.
+
+    Args:
+        event: Last event on the current page
+
+    Returns:
+        Cursor string of the form "<epoch microseconds>.<event id>"
+    """
+    micros = (event.timestamp - _EPOCH) // timedelta(microseconds=1)
+    return f"{micros}.{event.id}"
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string
+
+    Returns:
+        Tuple of (timestamp, event id)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    micros, event_id = cursor.split('.')
+    return _EPOCH + timedelta(microseconds=int(micros)), int(event_id)
+
+
+def page_query(household_uuid: str, cursor: Optional[str], limit: int):
+    """Build the query for one page of events; fetches one extra row to detect a next page."""
+    query = _events_query(household_uuid).limit(limit + 1)
+    if cursor:
+        query = query.where(tuple_(model.Event.timestamp, model.Event.id) < decode_cursor(cursor))
+    return query
+
+
+def page_rows(events_raw: list[Any], limit: int) -> tuple[list[EventRecord], Optional[str]]:
+    """Convert the rows of page_query into (event records, next cursor)."""
+    events_data = [_event_row(row) for row in events_raw[:limit]]
+    next_cursor = encode_cursor(events_data[-1]) if len(events_raw) > limit else None
+    return events_data, next_cursor
+
+
+def all_events(cursor: Optional[str] = None, limit: int = PAGE_SIZE) -> tuple[list[EventRecord], Optional[str]]:
+    """Get one page of events for the current user's household.
     
+    Args:
+        cursor: Cursor returned with the previous page, or None for the newest events
+        limit: Maximum number of events to return
+
     Returns:
-        List of dictionaries containing event information
+        Tuple of (list of event records, cursor for the next page or None if
+        this is the last page)
     """
     if not session.get('user') or not session.get('household'):
-        return []
+        return [], None
     
     household_uuid = session.get('household').uuid
-    events_raw = model.db.session.execute(
-        select(model.Event, model.Pet, model.FoodEvent, model.MedicineEvent, model.VitalsEvent)
-        .join(model.Pet, isouter=True)
-        .join(model.FoodEvent, isouter=True)
-        .join(model.MedicineEvent, isouter=True)
-        .join(model.VitalsEvent, isouter=True)
-        .order_by(model.Event.timestamp.desc())
-        .where(model.Event.household_uuid == household_uuid)
-    ).all()
+    return page_rows(model.db.session.execute(page_query(household_uuid, cursor, limit)).all(), limit)
 
-    event_data = []
-    for event, pet, food_event, medicine_event, vitals_event in events_raw:
-        meta = None
-        if event.type == model.EventType.Food and food_event:
-            meta = food_event.to_dict()
-        elif event.type == model.EventType.Medicine and medicine_event:
-            meta = medicine_event.to_dict()
-        elif event.type == model.EventType.Vitals and vitals_event:
-            meta = vitals_event.to_dict()
-        event_data.append({
-            'timestamp': event.timestamp,
-            'pet-name': pet.name if pet and pet.name else '',
-            'pet-icon': pet.photo_addr if pet and pet.photo_addr else '',
-            'type': event.type.name,
-            'meta': meta,
-        })
-    
-    return event_data
 
-def summary() -> list[dict[str, Any]]:
-    """Get a summary of events for the current user's household.
-    
+def stream_events(batch_size: int = PAGE_SIZE) -> Iterator[EventRecord]:
+    """Stream every event for the current user's household, newest first.
+
+    Rows are fetched from a server-side cursor in batches of batch_size, so
+    at most one batch is held in memory at a time. The returned iterator
+    must be consumed inside the request context (see stream_with_context).
+
+    Args:
+        batch_size: Number of rows fetched per round-trip
+
     Returns:
-        List of dictionaries containing event information
+        Iterator of event records
     """
     if not session.get('user') or not session.get('household'):
-        return []
-    
+        return iter(())
+
     household_uuid = session.get('household').uuid
-    events_raw = model.db.session.execute(
-        select(model.Event, model.Pet, model.FoodEvent, model.MedicineEvent, model.VitalsEvent)
-        .distinct(model.Event.type, model.Event.pet_uuid)
-        .join(model.Pet, isouter=True)
-        .join(model.FoodEvent, isouter=True)
-        .join(model.MedicineEvent, isouter=True)
-        .join(model.VitalsEvent, isouter=True)
-        .order_by(model.Event.type, model.Event.pet_uuid, model.Event.timestamp.desc())
-        .where(model.Event.household_uuid == household_uuid)
-    ).all()
+    result = model.db.session.execute(
+        _events_query(household_uuid).execution_options(yield_per=batch_size)
+    )
+    return (_event_row(row) for row in result)
+
+def summary_query(household_uuid: str):
+    """Build the query for the latest event of each (type, pet) in a household.
+
+    One row per (type, pet) from the latest_event pointers, so the cost
+    does not grow with the length of the household's history.
+    """
+    return (select(*_EVENT_COLUMNS)
+            .select_from(model.LatestEvent)
+            .join(model.Event, model.LatestEvent.event_id == model.Event.id)
+            .join(model.Pet, model.Event.pet_uuid == model.Pet.uuid, isouter=True)
+            .join(model.FoodEvent, isouter=True)
+            .join(model.MedicineEvent, isouter=True)
+            .join(model.VitalsEvent, isouter=True)
+            .where(model.LatestEvent.household_uuid == household_uuid)
+            .order_by(model.LatestEvent.type, model.LatestEvent.pet_uuid))
+
 
+def summary_rows(events_raw: list[Any]) -> list[SummaryRecord]:
+    """Convert the rows of summary_query into the records rendered by events.html."""
+    now = datetime.now(tz=model.APP_TIMEZONE)
     event_data = []
-    for event, pet, food_event, medicine_event, vitals_event in events_raw:
-        delta = datetime.now(tz=model.APP_TIMEZONE) - event.timestamp
+    for row in events_raw:
+        _, timestamp, event_type, pet_name, pet_icon = row[:5]
+        delta = now - timestamp
         if delta.days > 29:
             time_ago = "weeks ago"
         elif delta.days > 7:
@@ -225,23 +386,42 @@ def summary() -> list[dict[str, Any]]:
         else:
             time_ago = f"{delta.seconds} seconds ago"
 
-        meta = None
-        if event.type == model.EventType.Food and food_event:
-            meta = food_event.to_dict()
-        elif event.type == model.EventType.Medicine and medicine_event:
-            meta = medicine_event.to_dict()
-        elif event.type == model.EventType.Vitals and vitals_event:
-            meta = vitals_event.to_dict()
-        event_data.append({
-            'type': event.type.name,
-            'pet-name': pet.name if pet and pet.name else '',
-            'pet-icon': pet.photo_addr if pet and pet.photo_addr else '',
-            'time_ago': time_ago,
-            'meta': meta,
-        })
-    
+        event_data.append(SummaryRecord(event_type.name, pet_name or '', pet_icon or '', time_ago,
+                                        _event_meta(event_type, row)))
+
     return event_data
 
+
+def summary() -> list[SummaryRecord]:
+    """Get a summary of events for the current user's household.
+    
+    Returns:
+        List of summary records
+    """
+    if not session.get('user') or not session.get('household'):
+        return []
+    
+    household_uuid = session.get('household').uuid
+    return summary_rows(model.db.session.execute(summary_query(household_uuid)).all())
+
+
+def _format_day(day: date) -> str:
+    """Format a calendar date for display relative to today.
+
+    Args:
+        day: Calendar date
+
+    Returns:
+        "Today", "Yesterday", or an abbreviated month and day
+    """
+    today = datetime.now(tz=model.APP_TIMEZONE).date()
+    if day == today:
+        return "Today"
+    elif day == today - timedelta(days=1):
+        return "Yesterday"
+    return day.strftime("%b %d")
+
+
 def day_view(date: datetime) -> dict[str, Any]:
     """Get aggregated events for a specific day.
     
@@ -255,39 +435,53 @@ def day_view(date: datetime) -> dict[str, Any]:
         return {}
     
     household_uuid = session.get('household').uuid
-    start_date = date.replace(hour=0, minute=0, second=0, microsecond=0)
-    end_date = start_date + timedelta(days=1)
-    
-    query = (select(model.Event, model.Pet, model.FoodEvent, model.MedicineEvent, model.VitalsEvent)
-             .join(model.Pet, isouter=True)
-             .join(model.FoodEvent, isouter=True)
-             .join(model.MedicineEvent, isouter=True)
-             .join(model.VitalsEvent, isouter=True)
-             .where(model.Event.household_uuid == household_uuid)
-             .where(model.Event.timestamp >= start_date)
-             .where(model.Event.timestamp < end_date))
-    events_raw = model.db.session.execute(query).all()
-
-    event_data: dict[str, Any] = {'Food': {}, 'Litter': {}, 'Medicine': {}, 'Vitals': {}}
-    for event, pet, food_event, medicine_event, vitals_event in events_raw:
-        pet_name = pet.name if pet and pet.name else ''
-        pet_icon = pet.photo_addr if pet and pet.photo_addr else ''
-        match event.type:
-            case model.EventType.Food:
-                calories = float(food_event.calories) if food_event else 0
-                event_data['Food'][(pet_name, pet_icon)] = event_data['Food'].get((pet_name, pet_icon), 0) + calories
-            case model.EventType.Litter:
-                event_data['Litter'][(pet_name, pet_icon)] = event_data['Litter'].get((pet_name, pet_icon), 0) + 1
-            case model.EventType.Medicine:
-                event_data['Medicine'][(pet_name, pet_icon)] = event_data['Medicine'].get((pet_name, pet_icon), 0) + 1
-            case model.EventType.Vitals:
-                event_data['Vitals'][(pet_name, pet_icon)] = event_data['Vitals'].get((pet_name, pet_icon), 0) + 1
+    day = date.date()
+    return rollups.totals(household_uuid, day, day).get(day, {'Food': {}, 'Litter': {}, 'Medicine': {}, 'Vitals': {}})
 
-    return event_data
+
+def days_range(household_uuid: str, start_date: datetime, limit: int) -> tuple[Any, date]:
+    """Get the (first day, last day) range covering the last limit populated days.
+
+    The first day is a scalar subquery, so the range and its totals are
+    fetched in a single statement.
+    """
+    start_day = start_date.date()
+    populated_days = (select(model.DailyPetRollup.day)
+                      .where(model.DailyPetRollup.household_uuid == household_uuid)
+                      .where(model.DailyPetRollup.day <= start_day)
+                      .group_by(model.DailyPetRollup.day)
+                      .order_by(model.DailyPetRollup.day.desc())
+                      .limit(limit)
+                      .subquery())
+    return select(func.min(populated_days.c.day)).scalar_subquery(), start_day
+
+
+def days_rows(totals: dict[date, dict[str, Any]], limit: int) -> list[dict[str, Any]]:
+    """Convert rollup totals into the JSON-serializable day list of days_view."""
+    days_data = []
+    for day in sorted(totals, reverse=True)[:limit]:
+        # Convert tuple keys to JSON-serializable format
+        # Use a special delimiter that's unlikely to appear in pet names or paths
+        serializable_events: dict[str, Any] = {}
+        for event_type, event_data in totals[day].items():
+            serializable_events[event_type] = {
+                f"{pet_name}|||{pet_icon}": value for (pet_name, pet_icon), value in event_data.items()
+            }
+
+        days_data.append({
+            'date': _format_day(day),
+            'date_iso': day.strftime("%Y-%m-%d"),
+            'events': serializable_events
+        })
+
+    return days_data
 
 
 def days_view(start_date: datetime, limit: int = 10) -> list[dict[str, Any]]:
     """Get aggregated events for multiple days starting from a given date.
+
+    Reads from the daily_pet_rollup table: the most recent populated days
+    and their totals are fetched in a single statement.
     
     Args:
         start_date: Starting date (will go backwards in time from this date)
@@ -297,79 +491,11 @@ def days_view(start_date: datetime, limit: int = 10) -> list[dict[str, Any]]:
         List of dictionaries, each containing date and events for that day.
         Only includes days that have events. Days are ordered from newest to oldest.
     """
-    if not session.get('household'):
+    if not session.get('household') or limit < 1:
         return []
     
     household_uuid = session.get('household').uuid
-    days_data = []
-    
-    # Start from the given date and go backwards
-    current_date = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
-    
-    for _ in range(limit * 2):  # Check up to 2x limit days to find days with data
-        if len(days_data) >= limit:
-            break
-            
-        day_start = current_date
-        day_end = day_start + timedelta(days=1)
-        
-        query = (select(model.Event, model.Pet, model.FoodEvent, model.MedicineEvent, model.VitalsEvent)
-                 .join(model.Pet, isouter=True)
-                 .join(model.FoodEvent, isouter=True)
-                 .join(model.MedicineEvent, isouter=True)
-                 .join(model.VitalsEvent, isouter=True)
-                 .where(model.Event.household_uuid == household_uuid)
-                 .where(model.Event.timestamp >= day_start)
-                 .where(model.Event.timestamp < day_end))
-        events_raw = model.db.session.execute(query).all()
-        
-        # Only include days that have events
-        if events_raw:
-            event_data: dict[str, Any] = {'Food': {}, 'Litter': {}, 'Medicine': {}, 'Vitals': {}}
-            for event, pet, food_event, medicine_event, vitals_event in events_raw:
-                pet_name = pet.name if pet and pet.name else ''
-                pet_icon = pet.photo_addr if pet and pet.photo_addr else ''
-                
-                match event.type:
-                    case model.EventType.Food:
-                        calories = float(food_event.calories) if food_event else 0
-                        event_data['Food'][(pet_name, pet_icon)] = event_data['Food'].get((pet_name, pet_icon), 0) + calories
-                    case model.EventType.Litter:
-                        event_data['Litter'][(pet_name, pet_icon)] = event_data['Litter'].get((pet_name, pet_icon), 0) + 1
-                    case model.EventType.Medicine:
-                        event_data['Medicine'][(pet_name, pet_icon)] = event_data['Medicine'].get((pet_name, pet_icon), 0) + 1
-                    case model.EventType.Vitals:
-                        event_data['Vitals'][(pet_name, pet_icon)] = event_data['Vitals'].get((pet_name, pet_icon), 0) + 1
-            
-            # Convert tuple keys to JSON-serializable format
-            # Use a special delimiter that's unlikely to appear in pet names or paths
-            serializable_events: dict[str, Any] = {}
-            for event_type, event_data in event_data.items():
-                serializable_events[event_type] = {}
-                for pet_key, value in event_data.items():
-                    # Convert tuple to string key: "pet_name|||pet_icon"
-                    pet_name, pet_icon = pet_key
-                    key_str = f"{pet_name}|||{pet_icon}"
-                    serializable_events[event_type][key_str] = value
-            
-            # Format date for display
-            if current_date.date() == datetime.now(tz=model.APP_TIMEZONE).date():
-                date_str = "Today"
-            elif current_date.date() == (datetime.now(tz=model.APP_TIMEZONE) - timedelta(days=1)).date():
-                date_str = "Yesterday"
-            else:
-                date_str = current_date.strftime("%b %d")
-            
-            days_data.append({
-                'date': date_str,
-                'date_iso': current_date.strftime("%Y-%m-%d"),
-                'events': serializable_events
-            })
-        
-        # Move to previous day
-        current_date = current_date - timedelta(days=1)
-    
-    return days_data
+    return days_rows(rollups.totals(household_uuid, *days_range(household_uuid, start_date, limit)), limit)
 
 
 def new(household_uuid: str, event_type: model.EventType, created_by: str, 
@@ -409,8 +535,171 @@ def new(household_uuid: str, event_type: model.EventType, created_by: str,
             new_meta.event_id = new_event.id
             model.db.session.add(new_meta)
 
+        model.db.session.flush()
+        rollups.record([new_event.id])
+        rollups.record_latest([new_event.id])
+        versions.bump(household_uuid)
+
         model.db.session.commit()
+        metrics.EVENTS_CREATED.labels(event_type.name).inc()
         return new_event
     except Exception as e:
         model.db.session.rollback()
         raise
+
+
+# Text fields of a bulk item, with the column limiting their length (None if not stored as text)
+_BULK_STRING_FIELDS = {
+    'pet': None,
+    'food-name': model.FoodEvent.name,
+    'food-type': None,
+    'food-unit': None,
+    'medicine-name': model.MedicineEvent.name,
+    'medicine-dose': model.MedicineEvent.dose,
+}
+
+
+def _validate_bulk_item(item: Any, pet_uuids: set[str]) -> tuple[Optional[model.EventType], Optional[datetime], Optional[str]]:
+    """Validate one item of a bulk request.
+
+    Args:
+        item: Dictionary with 'type', optional 'timestamp' and the same
+            event-specific fields as the new event form
+        pet_uuids: UUIDs of the household's pets
+
+    Returns:
+        Tuple of (event type, timestamp, error message); the error is None when the item is valid
+    """
+    if not isinstance(item, dict):
+        return None, None, 'Event must be an object'
+
+    try:
+        raw_type = item.get('type')
+        event_type = model.EventType(int(raw_type)) if str(raw_type).isdigit() else model.EventType[raw_type]
+    except (KeyError, ValueError, TypeError):
+        return None, None, f"Invalid event type: {item.get('type')!r}"
+
+    timestamp = None
+    if item.get('timestamp'):
+        try:
+            timestamp = datetime.fromisoformat(item['timestamp'])
+        except (ValueError, TypeError):
+            return None, None, f"Invalid timestamp: {item.get('timestamp')!r}"
+        if timestamp.tzinfo is None:
+            timestamp = model.APP_TIMEZONE.localize(timestamp)
+
+    for field, column in _BULK_STRING_FIELDS.items():
+        value = item.get(field)
+        if value is None:
+            continue
+        if not isinstance(value, str):
+            return None, None, f'{field} must be a string'
+        if column is not None and len(value) > column.type.length:
+            return None, None, f'{field} must be at most {column.type.length} characters'
+    for field, parse in (('food-amount', float), ('food-calories', int)):
+        if item.get(field) not in (None, ''):
+            try:
+                # float() also accepts "nan" and "inf", which must not be stored
+                if not math.isfinite(parse(item[field])):
+                    raise ValueError(item[field])
+            except (ValueError, TypeError):
+                return None, None, f'{field} must be a number'
+
+    if item.get('pet') and item['pet'] not in pet_uuids:
+        return None, None, f"Unknown pet: {item['pet']!r}"
+
+    match event_type:
+        case model.EventType.Food if not item.get('food-name'):
+            return None, None, 'Food events require food-name'
+        case model.EventType.Medicine if not item.get('medicine-name') or not item.get('medicine-dose'):
+            return None, None, 'Medicine events require medicine-name and medicine-dose'
+        case model.EventType.Vitals:
+            try:
+                if not math.isfinite(float(item.get('vitals-weight'))):
+                    raise ValueError(item['vitals-weight'])
+            except (ValueError, TypeError):
+                return None, None, 'Vitals events require a numeric vitals-weight'
+
+    return event_type, timestamp, None
+
+
+def bulk_new(household_uuid: str, created_by: str, items: list[Any]) -> tuple[int, list[dict[str, Any]]]:
+    """Create many events in one transaction.
+
+    Each item is validated independently; invalid items are reported and
+    skipped without affecting the rest. Valid items are inserted in batches
+    of BULK_BATCH_SIZE with one multi-row INSERT ... RETURNING for the events
+    and one executemany per metadata table, instead of a flush per event.
+
+    Args:
+        household_uuid: UUID of the household
+        created_by: UUID of the user creating the events
+        items: List of event dictionaries (see _validate_bulk_item)
+
+    Returns:
+        Tuple of (number of events created, list of {'index', 'error'} for rejected items)
+    """
+    pet_uuids = set(model.db.session.execute(
+        select(model.Pet.uuid).where(model.Pet.household_uuid == household_uuid)
+    ).scalars())
+
+    errors = []
+    valid = []
+    for index, item in enumerate(items):
+        event_type, timestamp, error = _validate_bulk_item(item, pet_uuids)
+        if error:
+            errors.append({'index': index, 'error': error})
+            continue
+        match event_type:
+            case model.EventType.Food:
+                valid.append(_create_food_event(household_uuid, created_by, item, timestamp))
+            case model.EventType.Litter:
+                valid.append(_create_litter_event(household_uuid, created_by, item, timestamp))
+            case model.EventType.Medicine:
+                valid.append(_create_medicine_event(household_uuid, created_by, item, timestamp))
+            case model.EventType.Vitals:
+                valid.append(_create_vitals_event(household_uuid, created_by, item, timestamp))
+
+    try:
+        for start in range(0, len(valid), BULK_BATCH_SIZE):
+            batch = valid[start:start + BULK_BATCH_SIZE]
+            event_ids = model.db.session.execute(
+                insert(model.Event).returning(model.Event.id, sort_by_parameter_order=True),
+                [
+                    {
+                        'household_uuid': event.household_uuid,
+                        'pet_uuid': event.pet_uuid,
+                        'timestamp': event.timestamp,
+                        'type': event.type,
+                        'created_at': event.created_at,
+                        'created_by': event.created_by,
+                    }
+                    for event, _ in batch
+                ]
+            ).scalars().all()
+
+            meta_rows: dict[type, list[dict[str, Any]]] = {}
+            for event_id, (_, meta) in zip(event_ids, batch):
+                if meta is None:
+                    continue
+                row = {column.key: getattr(meta, column.key) for column in meta.__table__.columns
+                       if column.key not in ('uuid', 'event_id')}
+                row.update(uuid=str(uuid.uuid4()), event_id=event_id)
+                meta_rows.setdefault(type(meta), []).append(row)
+            for meta_model, rows in meta_rows.items():
+                model.db.session.execute(insert(meta_model), rows)
+
+            rollups.record(event_ids)
+            rollups.record_latest(event_ids)
+
+        if valid:
+            versions.bump(household_uuid)
+        model.db.session.commit()
+    except Exception:
+        model.db.session.rollback()
+        raise
+
+    for event, _ in valid:
+        metrics.EVENTS_CREATED.labels(event.type.name).inc()
+
+    return len(valid), errors
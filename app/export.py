@@ -0,0 +1,95 @@
+import csv
+import io
+import json
+import model
+
+from datetime import date, datetime, time, timedelta
+from sqlalchemy import select
+from typing import Any, Iterator, Optional
+
+COLUMNS = ['id', 'timestamp', 'type', 'pet_uuid', 'pet_name',
+           'food_name', 'food_type', 'serving_size', 'unit', 'calories',
+           'medicine_name', 'dose', 'vitals_type', 'vitals_value']
+
+# Rows per server-side cursor fetch, and approximate bytes per streamed chunk
+FETCH_SIZE = 1000
+CHUNK_SIZE = 64 * 1024
+
+
+def rows(household_uuid: str, start: Optional[date] = None, end: Optional[date] = None,
+         pet_uuid: Optional[str] = None) -> Iterator[tuple]:
+    """Stream a household's events as flat tuples in COLUMNS order, oldest first.
+
+    Only scalar columns are selected and they are fetched from a server-side
+    cursor, so memory use does not depend on the size of the export.
+
+    Args:
+        household_uuid: UUID of the household
+        start: Inclusive first local date, or None for the beginning of history
+        end: Inclusive last local date, or None for today
+        pet_uuid: Only export events for this pet
+
+    Returns:
+        Iterator of row tuples
+    """
+    query = (select(model.Event.id, model.Event.timestamp, model.Event.type, model.Event.pet_uuid, model.Pet.name,
+                    model.FoodEvent.name, model.FoodEvent.type, model.FoodEvent.serving_size, model.FoodEvent.unit,
+                    model.FoodEvent.calories, model.MedicineEvent.name, model.MedicineEvent.dose,
+                    model.VitalsEvent.type, model.VitalsEvent.value)
+             .join(model.Pet, isouter=True)
+             .join(model.FoodEvent, isouter=True)
+             .join(model.MedicineEvent, isouter=True)
+             .join(model.VitalsEvent, isouter=True)
+             .where(model.Event.household_uuid == household_uuid)
+             .order_by(model.Event.timestamp, model.Event.id))
+    if start:
+        query = query.where(model.Event.timestamp >= model.APP_TIMEZONE.localize(datetime.combine(start, time.min)))
+    if end:
+        query = query.where(model.Event.timestamp <
+                            model.APP_TIMEZONE.localize(datetime.combine(end + timedelta(days=1), time.min)))
+    if pet_uuid:
+        query = query.where(model.Event.pet_uuid == pet_uuid)
+
+    result = model.db.session.execute(query.execution_options(yield_per=FETCH_SIZE))
+    return (tuple(_plain(value) for value in row) for row in result)
+
+
+def _plain(value: Any) -> Any:
+    """Convert enum and datetime column values to JSON/CSV-friendly scalars."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (model.EventType, model.VitalsType)):
+        return value.name
+    if isinstance(value, (model.FoodType, model.Unit)):
+        return value.value
+    return value
+
+
+def csv_chunks(data: Iterator[tuple]) -> Iterator[str]:
+    """Encode rows as CSV with a header line, yielding roughly CHUNK_SIZE pieces."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(COLUMNS)
+    for row in data:
+        writer.writerow(row)
+        if buffer.tell() >= CHUNK_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def ndjson_chunks(data: Iterator[tuple]) -> Iterator[str]:
+    """Encode rows as newline-delimited JSON objects, yielding roughly CHUNK_SIZE pieces."""
+    lines = []
+    size = 0
+    for row in data:
+        line = json.dumps(dict(zip(COLUMNS, row)))
+        lines.append(line)
+        size += len(line) + 1
+        if size >= CHUNK_SIZE:
+            yield '\n'.join(lines) + '\n'
+            lines = []
+            size = 0
+    if lines:
+        yield '\n'.join(lines) + '\n'
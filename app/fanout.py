@@ -0,0 +1,71 @@
+import model
+
+from concurrent.futures import ThreadPoolExecutor
+from flask import copy_current_request_context, g, has_request_context
+from flask_sqlalchemy.record_queries import get_recorded_queries
+from typing import Any, Callable, Optional
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+# g values a task needs from the request; the rest of g (metrics timings,
+# the statement list) belongs to the request and must not be copied, or
+# its teardown hooks would run again for every task
+SHARED_G = ('household_tokens', 'household_version')
+
+
+def _pool() -> ThreadPoolExecutor:
+    """Get the worker thread pool, creating it on first use (after gunicorn forks)."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=model.app.config['FANOUT_WORKERS'],
+                                       thread_name_prefix='fanout')
+    return _executor
+
+
+def _task(func: Callable[[], Any]) -> Callable[[], tuple[Any, list]]:
+    """Wrap a call to run in a copy of the current request context.
+
+    The copy gets its own app context, and so its own database session and
+    connection. It starts with the request's SHARED_G values (the household
+    version read by versions.conditional) and its own statement list; the
+    statements it records are returned with the result so they can be added
+    to the request's own list.
+    """
+    shared = {key: g.get(key) for key in SHARED_G if key in g}
+
+    @copy_current_request_context
+    def run() -> tuple[Any, list]:
+        vars(g).update(shared)
+        return func(), list(get_recorded_queries())
+
+    return run
+
+
+def gather(*funcs: Callable[[], Any]) -> list[Any]:
+    """Run independent reads concurrently, each with its own session.
+
+    Latency is bounded by the slowest read rather than the sum of them.
+    The first call runs on the calling thread. Outside a request, or with
+    FANOUT_WORKERS set to 0, every call runs in turn.
+
+    Args:
+        funcs: Zero-argument callables, e.g. functools.partial(pets.all, household_uuid)
+
+    Returns:
+        The results of funcs, in order
+
+    Raises:
+        Exception: The first exception raised by any of funcs
+    """
+    if len(funcs) < 2 or not has_request_context() or not model.app.config['FANOUT_WORKERS']:
+        return [func() for func in funcs]
+
+    futures = [_pool().submit(_task(func)) for func in funcs[1:]]
+    results = [funcs[0]()]
+    for future in futures:
+        result, queries = future.result()
+        # Keep query budgets and /debug/perf counting the statements run elsewhere
+        if queries:
+            g.setdefault('_sqlalchemy_queries', []).extend(queries)
+        results.append(result)
+    return results
@@ -1,10 +1,15 @@
+import cache
 import model
 import uuid
+import versions
 from sqlalchemy import select
 from typing import Any
 
+@cache.household_cached('foods')
 def all(household_uuid: str) -> list[dict[str, Any]]:
     """Get all FoodMeta items for a household.
+
+    Cached per household until foods.create() adds a food.
     
     Args:
         household_uuid: UUID of the household
@@ -13,20 +18,21 @@ def all(household_uuid: str) -> list[dict[str, Any]]:
         List of dictionaries containing food metadata
     """
     food_data = model.db.session.execute(
-        select(model.FoodMeta).where(model.FoodMeta.household_uuid == household_uuid)
+        select(model.FoodMeta.uuid, model.FoodMeta.name, model.FoodMeta.type, model.FoodMeta.serving_size,
+               model.FoodMeta.unit, model.FoodMeta.calories)
+        .where(model.FoodMeta.household_uuid == household_uuid)
     ).all()
 
     foods = []
-    for row in food_data:
-        for food in row:
-            foods.append({
-                'uuid': food.uuid,
-                'name': food.name,
-                'type': food.type.value,
-                'serving_size': food.serving_size,
-                'unit': food.unit.value,
-                'calories': food.calories,
-            })
+    for food in food_data:
+        foods.append({
+            'uuid': food.uuid,
+            'name': food.name,
+            'type': food.type.value,
+            'serving_size': food.serving_size,
+            'unit': food.unit.value,
+            'calories': food.calories,
+        })
 
     return foods
 
@@ -42,7 +48,7 @@ def exists(household_uuid: str, name: str) -> bool:
         True if a food with this name exists, False otherwise
     """
     food_data = model.db.session.execute(
-        select(model.FoodMeta).where(
+        select(model.FoodMeta.uuid).where(
             model.FoodMeta.household_uuid == household_uuid,
             model.FoodMeta.name == name
         )
@@ -76,6 +82,7 @@ def create(household_uuid: str, name: str, food_type: str, serving_size: float,
     food.calories = calories
     
     model.db.session.add(food)
+    versions.bump(household_uuid)
     model.db.session.commit()
     return food
 
@@ -0,0 +1,79 @@
+import cache
+import hashlib
+import model
+import versions
+
+from flask import Flask, session
+from jinja2 import nodes
+from jinja2.ext import Extension
+from typing import Any, Callable, Optional
+
+_store: Optional[Any] = None
+
+
+def store() -> Any:
+    """Get the fragment store, creating it on first use.
+
+    Fragments share Redis with the read cache when READ_CACHE_BACKEND is
+    redis; in memory they get their own LRU so rendered pages do not evict
+    cached reads.
+    """
+    global _store
+    if _store is None:
+        if model.app.config['READ_CACHE_BACKEND'] == 'redis':
+            _store = cache.backend()
+        else:
+            _store = cache.MemoryBackend(model.app.config['FRAGMENT_CACHE_MAX_ENTRIES'])
+    return _store
+
+
+class FragmentCacheExtension(Extension):
+    """Jinja tag caching the HTML rendered by its body.
+
+        {% cache 'events', g.get('household_version'), cursor %}
+          ...
+        {% endcache %}
+
+    Cache whole blocks (a page of rows), not single rows. Each tag costs one
+    store lookup, a Redis round trip with READ_CACHE_BACKEND=redis, which
+    is more than rendering one row. The body is rendered into a string
+    before it is stored, so do not wrap a streamed loop in a tag.
+
+    The key is the deployed release (see versions.release), the current
+    household and a digest of the tag's arguments. The arguments must cover
+    everything the body depends on, usually the household change version
+    plus the request's own inputs. Keys never depend on per-process state,
+    so every worker agrees on them. The body is rendered without caching
+    when there is no household or any argument is None.
+    """
+    tags = {'cache'}
+
+    def parse(self, parser):
+        lineno = next(parser.stream).lineno
+        parts = [parser.parse_expression()]
+        while parser.stream.skip_if('comma'):
+            parts.append(parser.parse_expression())
+        body = parser.parse_statements(('name:endcache',), drop_needle=True)
+        return nodes.CallBlock(self.call_method('_render', [nodes.List(parts)]), [], [], body).set_lineno(lineno)
+
+    def _render(self, parts: list[Any], caller: Callable[[], str]) -> str:
+        household = session.get('household')
+        if not model.app.config['FRAGMENT_CACHE_ENABLED'] or not household or None in parts:
+            return caller()
+
+        digest = hashlib.sha1(repr(parts).encode()).hexdigest()
+        key = f"fragment:{versions.release()}:{household.uuid}:{parts[0]}:{digest}"
+        html = store().get(key)
+        if html is cache.MISSING:
+            html = str(caller())
+            store().set(key, html, model.app.config['FRAGMENT_CACHE_TTL'])
+        return html
+
+
+def init_app(app: Flask) -> None:
+    """Install the {% cache %} template tag.
+
+    Args:
+        app: Flask application
+    """
+    app.jinja_env.add_extension(FragmentCacheExtension)
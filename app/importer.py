@@ -0,0 +1,182 @@
+import argparse
+import csv
+import events
+import io
+import model
+import os
+import users
+
+from itertools import islice
+from sqlalchemy import func, select
+from typing import Any, Callable, Iterable, Optional
+
+# Rows per transaction when importing
+DEFAULT_BATCH_SIZE = 500
+
+
+def _resolve_pets(household_uuid: str) -> dict[str, str]:
+    """Map the household's pet UUIDs and lower-cased names to pet UUIDs."""
+    pets = model.db.session.execute(
+        select(model.Pet.uuid, model.Pet.name).where(model.Pet.household_uuid == household_uuid)
+    ).all()
+    resolved = {pet_uuid: pet_uuid for pet_uuid, _ in pets}
+    resolved.update({name.lower(): pet_uuid for pet_uuid, name in pets if name})
+    return resolved
+
+
+def _resolve_batch(household_uuid: str, rows: list[dict[str, Any]],
+                   pets: dict[str, str]) -> tuple[list[tuple[int, dict[str, Any]]], list[dict[str, Any]]]:
+    """Fill in a batch of rows from the household's saved foods, medicines and pets.
+
+    Food and medicine names are matched case-insensitively against FoodMeta
+    and MedicineMeta with one query each for the whole batch. A matched food
+    supplies any missing type and unit, and its calories are scaled to the
+    row's amount when the row does not give calories itself.
+
+    Args:
+        household_uuid: UUID of the household
+        rows: Parsed CSV rows using the new event form's field names
+        pets: Result of _resolve_pets
+
+    Returns:
+        Tuple of (list of (index in rows, row ready for events.bulk_new), list
+        of {'index', 'error'} for rows that cannot be resolved)
+    """
+    food_names = {row['food-name'].lower() for row in rows if row.get('food-name')}
+    medicine_names = {row['medicine-name'].lower() for row in rows if row.get('medicine-name')}
+    foods = {}
+    if food_names:
+        foods = {food.name.lower(): food for food in model.db.session.execute(
+            select(model.FoodMeta)
+            .where(model.FoodMeta.household_uuid == household_uuid)
+            .where(func.lower(model.FoodMeta.name).in_(food_names))
+        ).scalars()}
+    medicines = {}
+    if medicine_names:
+        medicines = {name.lower(): name for name in model.db.session.execute(
+            select(model.MedicineMeta.name)
+            .where(model.MedicineMeta.household_uuid == household_uuid)
+            .where(func.lower(model.MedicineMeta.name).in_(medicine_names))
+        ).scalars()}
+
+    resolved = []
+    errors = []
+    for index, row in enumerate(rows):
+        row = {key: value for key, value in row.items() if value not in (None, '')}
+        if row.get('pet'):
+            row['pet'] = pets.get(row['pet'], pets.get(row['pet'].lower(), row['pet']))
+
+        food = foods.get(row.get('food-name', '').lower())
+        if food:
+            row['food-name'] = food.name
+            row.setdefault('food-type', food.type.value)
+            row.setdefault('food-unit', food.unit.value)
+            if 'food-calories' not in row:
+                if not food.serving_size:
+                    errors.append({'index': index,
+                                   'error': f'Saved food {food.name!r} has no serving size; give food-calories'})
+                    continue
+                try:
+                    amount = float(row.get('food-amount', food.serving_size))
+                except ValueError:
+                    amount = food.serving_size
+                row['food-amount'] = amount
+                row['food-calories'] = food.calorie_count(amount)
+
+        if row.get('medicine-name'):
+            row['medicine-name'] = medicines.get(row['medicine-name'].lower(), row['medicine-name'])
+
+        resolved.append((index, row))
+    return resolved, errors
+
+
+def import_rows(household_uuid: str, created_by: str, rows: Iterable[dict[str, Any]],
+                batch_size: int = DEFAULT_BATCH_SIZE, start_row: int = 0,
+                on_checkpoint: Optional[Callable[[int], None]] = None) -> dict[str, Any]:
+    """Import events from an iterable of CSV rows, one committed batch at a time.
+
+    Rows are consumed lazily, so a file of any size is held at most one
+    batch at a time. After each batch commits, on_checkpoint receives the
+    number of rows processed so far; passing that back as start_row resumes
+    an interrupted import without duplicating events.
+
+    Args:
+        household_uuid: UUID of the household
+        created_by: UUID of the importing user
+        rows: Dictionaries with 'type', 'timestamp' and new event form fields
+        batch_size: Rows per transaction
+        start_row: Number of leading rows to skip (already imported)
+        on_checkpoint: Called with the processed row count after each batch
+
+    Returns:
+        Dictionary with 'rows' processed, events 'created' and per-row 'errors'
+
+    Raises:
+        ValueError: If batch_size is less than 1 or start_row is negative
+    """
+    if batch_size < 1:
+        raise ValueError('batch_size must be at least 1')
+    if start_row < 0:
+        raise ValueError('start_row must not be negative')
+
+    pets = _resolve_pets(household_uuid)
+    iterator = iter(rows)
+    for _ in islice(iterator, start_row):
+        pass
+
+    processed = start_row
+    created = 0
+    errors = []
+    while batch := list(islice(iterator, batch_size)):
+        resolved, batch_errors = _resolve_batch(household_uuid, batch, pets)
+        batch_created, bulk_errors = events.bulk_new(household_uuid, created_by, [row for _, row in resolved])
+        created += batch_created
+        # bulk_new indexes into the resolved rows; map back to the batch
+        batch_errors.extend({'index': resolved[error['index']][0], 'error': error['error']} for error in bulk_errors)
+        # Report errors by 1-based data row number in the file
+        errors.extend({'row': processed + error['index'] + 1, 'error': error['error']}
+                      for error in sorted(batch_errors, key=lambda error: error['index']))
+        processed += len(batch)
+        if on_checkpoint:
+            on_checkpoint(processed)
+
+    return {'rows': processed, 'created': created, 'errors': errors}
+
+
+def reader(stream: io.TextIOBase) -> Iterable[dict[str, Any]]:
+    """Parse a CSV stream lazily; the header row names the fields."""
+    return csv.DictReader(stream)
+
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser(description="Import historical events from a CSV file.")
+  parser.add_argument('path', help='CSV file with a header row of new event form field names')
+  parser.add_argument('--email', required=True, help='email of the importing user')
+  parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+  args = parser.parse_args()
+  if args.batch_size < 1:
+    parser.error('--batch-size must be at least 1')
+
+  # Progress is recorded next to the file so a rerun resumes where it stopped
+  checkpoint_path = args.path + '.checkpoint'
+  start_row = 0
+  if os.path.exists(checkpoint_path):
+    with open(checkpoint_path) as f:
+      start_row = int(f.read().strip() or 0)
+
+  def save_checkpoint(processed: int) -> None:
+    with open(checkpoint_path, 'w') as f:
+      f.write(str(processed))
+    print(f'{processed} rows imported')
+
+  with model.app.app_context():
+    user, household = users.get_identity(args.email)
+    if not user or not household:
+      raise SystemExit(f'No user with a household for {args.email}')
+
+    with open(args.path, newline='', encoding='utf-8-sig') as f:
+      summary = import_rows(household.uuid, user.uuid, reader(f), args.batch_size, start_row, save_checkpoint)
+
+    for error in summary['errors']:
+      print(f"row {error['row']}: {error['error']}")
+    print(f"Done: {summary['created']} events created from {summary['rows']} rows")
@@ -0,0 +1,92 @@
+import functools
+import json
+
+from dataclasses import fields, is_dataclass
+from datetime import date
+from enum import Enum
+from flask import Flask, Response
+from flask.json.provider import DefaultJSONProvider
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # Optional; the stdlib encoder produces the same output
+    orjson = None
+
+_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS if orjson else 0
+
+
+@functools.cache
+def _record_keys(cls: type) -> tuple[tuple[str, str], ...]:
+    """Get the (field name, JSON key) pairs of a record class.
+
+    A record's json_keys maps each of its fields to the key it is written
+    under; records without json_keys use their field names.
+
+    Raises:
+        KeyError: If json_keys is missing one of the fields
+    """
+    json_keys = getattr(cls, 'json_keys', None)
+    return tuple((field.name, json_keys[field.name] if json_keys is not None else field.name)
+                 for field in fields(cls))
+
+
+def _default(o: Any) -> Any:
+    """Encode result records, dates and enums; anything else as Flask does.
+
+    Used by both encoders. orjson handles dates and enums itself but passes
+    records through here, so their json_keys apply, and types such as Decimal.
+    """
+    if is_dataclass(o):
+        # Read the fields directly rather than through dataclasses.asdict,
+        # which deep-copies every value
+        return {key: getattr(o, name) for name, key in _record_keys(type(o))}
+    if isinstance(o, date):
+        return o.isoformat()
+    if isinstance(o, Enum):
+        return o.value
+    return DefaultJSONProvider.default(o)
+
+
+class RecordJSONProvider(DefaultJSONProvider):
+    """JSON provider for the result records, with orjson when it is installed.
+
+    Records are encoded with their json_keys (or field names) as keys, dates and datetimes
+    as ISO 8601 strings, and enums (EventType, FoodType, Unit, VitalsType)
+    as their values. Without orjson the stdlib encoder is used with the
+    same rules.
+    """
+    default = staticmethod(_default)
+    # Key order is the order the views build them in; sorting costs time
+    sort_keys = False
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if orjson is None or kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=_default, option=_OPTIONS).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if orjson is None or kwargs:
+            return json.loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        if orjson is None:
+            return super().response(*args, **kwargs)
+        # Hand orjson's bytes straight to the response without a str round-trip
+        obj = self._prepare_response_obj(args, kwargs)
+        option = _OPTIONS | orjson.OPT_APPEND_NEWLINE
+        # Indent like Flask does: in debug mode unless compact is set, or when compact is False
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            option |= orjson.OPT_INDENT_2
+        data = orjson.dumps(obj, default=_default, option=option)
+        return self._app.response_class(data, mimetype=self.mimetype)
+
+
+def init_app(app: Flask) -> None:
+    """Use RecordJSONProvider for jsonify and the tojson template filter.
+
+    Args:
+        app: Flask application
+    """
+    app.json = RecordJSONProvider(app)
@@ -1,10 +1,15 @@
+import cache
 import model
 import uuid
+import versions
 from sqlalchemy import select
 from typing import Any
 
+@cache.household_cached('medicine')
 def all(household_uuid: str) -> list[dict[str, Any]]:
     """Get all MedicineMeta items for a household.
+
+    Cached per household until medicine.create() adds a medicine.
     
     Args:
         household_uuid: UUID of the household
@@ -13,16 +18,16 @@ def all(household_uuid: str) -> list[dict[str, Any]]:
         List of dictionaries containing medicine metadata
     """
     medicines_raw = model.db.session.execute(
-        select(model.MedicineMeta).where(model.MedicineMeta.household_uuid == household_uuid)
+        select(model.MedicineMeta.uuid, model.MedicineMeta.name)
+        .where(model.MedicineMeta.household_uuid == household_uuid)
     ).all()
 
     medicines = []
-    for row in medicines_raw:
-        for med in row:
-            medicines.append({
-                'uuid': med.uuid,
-                'name': med.name,
-            })
+    for med in medicines_raw:
+        medicines.append({
+            'uuid': med.uuid,
+            'name': med.name,
+        })
 
     return medicines
 
@@ -38,7 +43,7 @@ def exists(household_uuid: str, name: str) -> bool:
         True if a medicine with this name exists, False otherwise
     """
     medicine_data = model.db.session.execute(
-        select(model.MedicineMeta).where(
+        select(model.MedicineMeta.uuid).where(
             model.MedicineMeta.household_uuid == household_uuid,
             model.MedicineMeta.name == name
         )
@@ -63,6 +68,7 @@ def create(household_uuid: str, name: str) -> model.MedicineMeta:
     medicine.name = name
     
     model.db.session.add(medicine)
+    versions.bump(household_uuid)
     model.db.session.commit()
     return medicine
 
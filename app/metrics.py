@@ -0,0 +1,109 @@
+import model
+import os
+import pool_stats
+import time
+
+from flask import Flask, Response, g, has_request_context, request
+from prometheus_client import (CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Gauge, Histogram,
+                               generate_latest, multiprocess, REGISTRY)
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# With PROMETHEUS_MULTIPROC_DIR set (gunicorn.conf.py defaults it) every
+# worker writes its samples to a shared directory and /metrics aggregates
+# all of them.
+REQUEST_LATENCY = Histogram(
+    'http_request_duration_seconds', 'Request latency by Flask endpoint',
+    ['endpoint', 'method', 'status'],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+IN_FLIGHT = Gauge('http_requests_in_flight', 'Requests currently being handled', multiprocess_mode='livesum')
+DB_QUERY_DURATION = Histogram(
+    'db_query_duration_seconds', 'SQL statement execution time by Flask endpoint', ['endpoint'],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0),
+)
+POOL_CHECKED_OUT = Gauge('db_pool_checked_out', 'Connections checked out of the pool', multiprocess_mode='livesum')
+POOL_OVERFLOW = Gauge('db_pool_overflow', 'Overflow connections open beyond the pool size', multiprocess_mode='livesum')
+POOL_WAIT = Gauge('db_pool_wait_seconds_total', 'Cumulative time spent waiting for a pooled connection',
+                  multiprocess_mode='livesum')
+POOL_TIMEOUTS = Gauge('db_pool_timeouts_total', 'Checkouts that timed out waiting for a connection',
+                      multiprocess_mode='livesum')
+CACHE_REQUESTS = Counter('read_cache_requests_total', 'Household read cache lookups', ['namespace', 'result'])
+EVENTS_CREATED = Counter('events_created_total', 'Events created', ['type'])
+
+
+def _endpoint() -> str:
+    return (request.endpoint or 'unmatched') if has_request_context() else 'none'
+
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('metrics_start', []).append((cursor, time.perf_counter()))
+
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    _, start = conn.info['metrics_start'].pop()
+    DB_QUERY_DURATION.labels(_endpoint()).observe(time.perf_counter() - start)
+
+
+@event.listens_for(Engine, 'handle_error')
+def _handle_error(context):
+    # A failed statement never reaches after_cursor_execute; drop its start
+    # time so later statements pair with their own. Errors raised outside
+    # execution (connecting, or fetching after after_cursor_execute) have
+    # no entry for their cursor and leave the stack alone.
+    if context.connection is None or context.execution_context is None:
+        return
+    stack = context.connection.info.get('metrics_start')
+    if stack and stack[-1][0] is context.execution_context.cursor:
+        stack.pop()
+
+
+def _before_request() -> None:
+    g.metrics_start = time.perf_counter()
+    g.metrics_status = 500
+    IN_FLIGHT.inc()
+
+
+def _after_request(response):
+    g.metrics_status = response.status_code
+    update_pool(pool_stats.snapshot(model.db.engine.pool))
+    return response
+
+
+def _teardown_request(exc) -> None:
+    if 'metrics_start' not in g:
+        return
+    IN_FLIGHT.dec()
+    REQUEST_LATENCY.labels(_endpoint(), request.method, str(g.metrics_status)).observe(
+        time.perf_counter() - g.metrics_start)
+
+
+def update_pool(snapshot: dict) -> None:
+    """Publish this worker's pool state (see pool_stats.snapshot)."""
+    POOL_CHECKED_OUT.set(snapshot.get('checked_out', 0))
+    POOL_OVERFLOW.set(max(snapshot.get('overflow', 0), 0))
+    POOL_WAIT.set(snapshot['wait_seconds_total'])
+    POOL_TIMEOUTS.set(snapshot['timeouts'])
+
+
+def render() -> Response:
+    """Render all metrics in the Prometheus text format."""
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return Response(generate_latest(registry), mimetype=CONTENT_TYPE_LATEST)
+
+
+def init_app(app: Flask) -> None:
+    """Install the request instrumentation hooks.
+
+    Args:
+        app: Flask application
+    """
+    app.before_request(_before_request)
+    app.after_request(_after_request)
+    app.teardown_request(_teardown_request)
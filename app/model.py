@@ -3,29 +3,68 @@ import os
 from flask import Flask
 from flask_session import Session
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import Float, Integer, String, DateTime, JSON, ForeignKey, Boolean, create_engine
+from sqlalchemy import BigInteger, Float, Integer, String, Date, DateTime, JSON, ForeignKey, Boolean, Index, LargeBinary, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
-from datetime import datetime
+from datetime import date, datetime
 from enum import Enum
 from typing import Any
 from pytz import timezone
 
 # Configuration constants
 APP_TIMEZONE = timezone(os.environ.get('APP_TIMEZONE', 'America/Los_Angeles'))
+IDENTITY_CACHE_TTL = int(os.environ.get('IDENTITY_CACHE_TTL', 300))  # Seconds
 
 
 app = Flask(__name__)
 
 app.config["SESSION_PERMANENT"] = False     # Sessions expire when the browser is closed
-app.config["SESSION_TYPE"] = "filesystem"
+app.config["SESSION_TYPE"] = os.environ.get('SESSION_TYPE', 'memory')  # memory, sqlalchemy or filesystem
+app.config["SESSION_MEMORY_MAX_ENTRIES"] = int(os.environ.get('SESSION_MEMORY_MAX_ENTRIES', 10000))
+app.config["SESSION_REFRESH_INTERVAL"] = int(os.environ.get('SESSION_REFRESH_INTERVAL', 300))  # Seconds an unchanged session's expiry may lag before it is extended
 app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get("DATABASE_URL")
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 app.config['SQLALCHEMY_RECORD_QUERIES'] = True
 app.config['SQLALCHEMY_ECHO'] = os.environ.get('SQLALCHEMY_ECHO', 'False').lower() == 'true'
-
-Session(app)
+app.config['QUERY_BUDGET_ENFORCE'] = os.environ.get('QUERY_BUDGET_ENFORCE', os.environ.get('FLASK_DEBUG', 'False')).lower() in ('true', '1')
+app.config['PROFILING_ENABLED'] = os.environ.get('PROFILING_ENABLED', 'False').lower() == 'true'  # Server-Timing and /debug/perf
+# Identifies the deployed code in ETags (versions.py); defaults to a digest of the app's code and templates
+app.config['RELEASE'] = os.environ.get('RELEASE')
+
+# Household read cache (cache.py): memory (per process) or redis (shared, needs READ_CACHE_URL)
+app.config['READ_CACHE_BACKEND'] = os.environ.get('READ_CACHE_BACKEND', 'memory')
+app.config['READ_CACHE_URL'] = os.environ.get('READ_CACHE_URL', 'redis://localhost:6379/0')
+app.config['READ_CACHE_MAX_ENTRIES'] = int(os.environ.get('READ_CACHE_MAX_ENTRIES', 10000))
+app.config['READ_CACHE_TTL'] = int(os.environ.get('READ_CACHE_TTL', 300))  # Seconds
+# Rendered template fragments (fragments.py); in memory they get their own LRU
+app.config['FRAGMENT_CACHE_ENABLED'] = os.environ.get('FRAGMENT_CACHE_ENABLED', 'True').lower() == 'true'
+app.config['FRAGMENT_CACHE_MAX_ENTRIES'] = int(os.environ.get('FRAGMENT_CACHE_MAX_ENTRIES', 50000))
+app.config['FRAGMENT_CACHE_TTL'] = int(os.environ.get('FRAGMENT_CACHE_TTL', 86400))  # Seconds
+# Response compression (compression.py); brotli is used when the package is installed
+app.config['COMPRESS_MIN_SIZE'] = int(os.environ.get('COMPRESS_MIN_SIZE', 1024))  # Bytes, smaller bodies are sent as is
+app.config['COMPRESS_GZIP_LEVEL'] = int(os.environ.get('COMPRESS_GZIP_LEVEL', 6))
+app.config['COMPRESS_BROTLI_QUALITY'] = int(os.environ.get('COMPRESS_BROTLI_QUALITY', 4))
+
+# Connection pool; size it to (gunicorn workers x threads) against Postgres max_connections
+app.config['DB_POOL_SIZE'] = int(os.environ.get('DB_POOL_SIZE', 5))
+app.config['DB_MAX_OVERFLOW'] = int(os.environ.get('DB_MAX_OVERFLOW', 10))
+app.config['DB_POOL_TIMEOUT'] = int(os.environ.get('DB_POOL_TIMEOUT', 30))             # Seconds
+app.config['DB_POOL_RECYCLE'] = int(os.environ.get('DB_POOL_RECYCLE', 1800))           # Seconds
+app.config['DB_POOL_PRE_PING'] = os.environ.get('DB_POOL_PRE_PING', 'True').lower() == 'true'
+app.config['DB_STATEMENT_TIMEOUT'] = int(os.environ.get('DB_STATEMENT_TIMEOUT', 30000))  # Milliseconds, 0 disables
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'pool_size': app.config['DB_POOL_SIZE'],
+    'max_overflow': app.config['DB_MAX_OVERFLOW'],
+    'pool_timeout': app.config['DB_POOL_TIMEOUT'],
+    'pool_recycle': app.config['DB_POOL_RECYCLE'],
+    'pool_pre_ping': app.config['DB_POOL_PRE_PING'],
+    'connect_args': {'options': f"-c statement_timeout={app.config['DB_STATEMENT_TIMEOUT']}"},
+}
+# Threads per process for concurrent page reads (fanout.py); each holds its own pooled connection, 0 disables
+app.config['FANOUT_WORKERS'] = int(os.environ.get('FANOUT_WORKERS', 4))
+
+if app.config["SESSION_TYPE"] == "filesystem":
+    Session(app)            # Other backends are installed by sessions.init_app
 db = SQLAlchemy(app)
-engine = create_engine(app.config['SQLALCHEMY_DATABASE_URI'])
 
 class Species(Enum):
   CAT = 1
@@ -68,6 +107,10 @@ class FoodType(Enum):
 class Base(DeclarativeBase):
     pass
 
+# Relationships below use lazy='raise': every query states what it loads
+# (explicit joins or column selects), and touching an unloaded relationship
+# fails loudly instead of issuing a hidden per-row query.
+
 db.Model.registry.update_type_annotation_map(
   {
     datetime: DateTime(timezone=True),
@@ -92,6 +135,8 @@ class Household(db.Model):
     uuid: Mapped[str] = mapped_column(String(64), primary_key=True)
     name: Mapped[str] = mapped_column(String(64))
     email: Mapped[str] = mapped_column(String(64), index=True)
+    change_version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default='0')
+    changed_at: Mapped[datetime] = mapped_column(nullable=False, server_default=func.now())
 
     def __repr__(self):
         return "<Household %s>" % (self.name)
@@ -100,7 +145,7 @@ class Pet(db.Model):
     """Pet model representing a pet in a household."""
     uuid: Mapped[str] = mapped_column(String(64), primary_key=True)
     household_uuid: Mapped[str] = mapped_column(String(64), ForeignKey('household.uuid'), nullable=True)
-    household: Mapped["Household"] = relationship()
+    household: Mapped["Household"] = relationship(lazy='raise')
     species: Mapped[Species]
     name: Mapped[str] = mapped_column(String(64))
     birthdate: Mapped[datetime] = mapped_column(nullable=True)
@@ -114,26 +159,31 @@ class UserHousehold(db.Model):
     """Join table linking users to households (many-to-many relationship)."""
     id: Mapped[int] = mapped_column(Integer, autoincrement=True, primary_key=True)
     user_id: Mapped[str] = mapped_column(String(64), ForeignKey('app_user.uuid'))
-    user: Mapped["AppUser"] = relationship()
+    user: Mapped["AppUser"] = relationship(lazy='raise')
     household_id: Mapped[str] = mapped_column(String(64), ForeignKey('household.uuid'))
-    household: Mapped["Household"] = relationship()
+    household: Mapped["Household"] = relationship(lazy='raise')
 
     def __repr__(self):
-        return "<UserHousehold %s - %s>" % (self.user, self.household)
+        return "<UserHousehold %s - %s>" % (self.user_id, self.household_id)
 
 
 class Event(db.Model):
     """Event model representing care activities (feeding, litter, medicine, etc.)."""
     id: Mapped[int] = mapped_column(Integer, autoincrement=True, primary_key=True)
     household_uuid: Mapped[str] = mapped_column(String(64), ForeignKey('household.uuid'), nullable=False)
-    household: Mapped["Household"] = relationship()
+    household: Mapped["Household"] = relationship(lazy='raise')
     pet_uuid: Mapped[str] = mapped_column(String(64), ForeignKey('pet.uuid'), nullable=True)
-    pet: Mapped["Pet"] = relationship()
+    pet: Mapped["Pet"] = relationship(lazy='raise')
     timestamp: Mapped[datetime] = mapped_column(nullable=False)
     type: Mapped[EventType] = mapped_column(nullable=False, index=True)
     created_at: Mapped[datetime] = mapped_column(nullable=False)
     created_by: Mapped[str] = mapped_column(String(64), ForeignKey('app_user.uuid'), nullable=True)
-    created_by_user: Mapped["AppUser"] = relationship()
+    created_by_user: Mapped["AppUser"] = relationship(lazy='raise')
+
+    __table_args__ = (
+        Index('ix_event_household_uuid_timestamp', 'household_uuid', 'timestamp', 'id'),
+        Index('ix_event_household_uuid_type_pet_uuid_timestamp', 'household_uuid', 'type', 'pet_uuid', 'timestamp'),
+    )
 
     def __repr__(self):
         return '<Event %s - %s>' % (self.type, self.timestamp)
@@ -144,9 +194,9 @@ class SavedEvent(db.Model):
     uuid: Mapped[str] = mapped_column(String(64), primary_key=True)
     name: Mapped[str] = mapped_column(String(64), nullable=True)
     household_uuid: Mapped[str] = mapped_column(String(64), ForeignKey('household.uuid'), nullable=False)
-    household: Mapped["Household"] = relationship()
+    household: Mapped["Household"] = relationship(lazy='raise')
     pet_uuid: Mapped[str] = mapped_column(String(64), ForeignKey('pet.uuid'), nullable=True)
-    pet: Mapped["Pet"] = relationship()
+    pet: Mapped["Pet"] = relationship(lazy='raise')
     type: Mapped[EventType] = mapped_column(nullable=False, index=True)
     meta: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=True)
 
@@ -158,13 +208,17 @@ class FoodEvent(db.Model):
     """Food metadata model storing nutritional information for food items."""
     uuid: Mapped[str] = mapped_column(String(64), primary_key=True)
     event_id: Mapped[int] = mapped_column(Integer, ForeignKey('event.id'))
-    event: Mapped["Event"] = relationship()
+    event: Mapped["Event"] = relationship(lazy='raise')
     name: Mapped[str] = mapped_column(String(64))
     type: Mapped[FoodType] = mapped_column(nullable=False)
     serving_size: Mapped[float] = mapped_column(Float)
     unit: Mapped[Unit] = mapped_column(nullable=False)
     calories: Mapped[int] = mapped_column(Integer)
 
+    __table_args__ = (
+        Index('ix_food_event_event_id', 'event_id', postgresql_include=['calories']),
+    )
+
     def __repr__(self):
         return f"<FoodEvent {self.name} - {self.type.value}>"
 
@@ -181,8 +235,8 @@ class FoodEvent(db.Model):
 class MedicineEvent(db.Model):
     """Food metadata model storing nutritional information for food items."""
     uuid: Mapped[str] = mapped_column(String(64), primary_key=True)
-    event_id: Mapped[int] = mapped_column(Integer, ForeignKey('event.id'))
-    event: Mapped["Event"] = relationship()
+    event_id: Mapped[int] = mapped_column(Integer, ForeignKey('event.id'), index=True)
+    event: Mapped["Event"] = relationship(lazy='raise')
     name: Mapped[str] = mapped_column(String(64), nullable=False)
     dose: Mapped[str] = mapped_column(String(64), nullable=False)
 
@@ -198,8 +252,8 @@ class MedicineEvent(db.Model):
 class VitalsEvent(db.Model):
     """Food metadata model storing nutritional information for food items."""
     uuid: Mapped[str] = mapped_column(String(64), primary_key=True)
-    event_id: Mapped[int] = mapped_column(Integer, ForeignKey('event.id'))
-    event: Mapped["Event"] = relationship()
+    event_id: Mapped[int] = mapped_column(Integer, ForeignKey('event.id'), index=True)
+    event: Mapped["Event"] = relationship(lazy='raise')
     type: Mapped[VitalsType] = mapped_column(nullable=False)
     value: Mapped[float] = mapped_column(Float, nullable=False)
 
@@ -213,11 +267,53 @@ class VitalsEvent(db.Model):
         }
 
 
+class DailyPetRollup(db.Model):
+    """Per-day event totals for a pet, maintained as events are created."""
+    id: Mapped[int] = mapped_column(Integer, autoincrement=True, primary_key=True)
+    household_uuid: Mapped[str] = mapped_column(String(64), ForeignKey('household.uuid'), nullable=False)
+    household: Mapped["Household"] = relationship(lazy='raise')
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+    pet_uuid: Mapped[str] = mapped_column(String(64), ForeignKey('pet.uuid'), nullable=True)
+    pet: Mapped["Pet"] = relationship(lazy='raise')
+    type: Mapped[EventType] = mapped_column(nullable=False)
+    calories: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    event_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index('ix_daily_pet_rollup_household_uuid_day_pet_uuid_type',
+              'household_uuid', 'day', 'pet_uuid', 'type', unique=True, postgresql_nulls_not_distinct=True),
+    )
+
+    def __repr__(self):
+        return '<DailyPetRollup %s - %s - %s>' % (self.day, self.type, self.event_count)
+
+
+class LatestEvent(db.Model):
+    """Pointer to the most recent event of each type for each pet in a household."""
+    id: Mapped[int] = mapped_column(Integer, autoincrement=True, primary_key=True)
+    household_uuid: Mapped[str] = mapped_column(String(64), ForeignKey('household.uuid'), nullable=False)
+    household: Mapped["Household"] = relationship(lazy='raise')
+    type: Mapped[EventType] = mapped_column(nullable=False)
+    pet_uuid: Mapped[str] = mapped_column(String(64), ForeignKey('pet.uuid'), nullable=True)
+    pet: Mapped["Pet"] = relationship(lazy='raise')
+    event_id: Mapped[int] = mapped_column(Integer, ForeignKey('event.id'), nullable=False)
+    event: Mapped["Event"] = relationship(lazy='raise')
+    timestamp: Mapped[datetime] = mapped_column(nullable=False)
+
+    __table_args__ = (
+        Index('ix_latest_event_household_uuid_type_pet_uuid',
+              'household_uuid', 'type', 'pet_uuid', unique=True, postgresql_nulls_not_distinct=True),
+    )
+
+    def __repr__(self):
+        return '<LatestEvent %s - %s>' % (self.type, self.timestamp)
+
+
 class FoodMeta(db.Model):
     """Food metadata model storing nutritional information for food items."""
     uuid: Mapped[str] = mapped_column(String(64), primary_key=True)
     household_uuid: Mapped[str] = mapped_column(String(64), ForeignKey('household.uuid'))
-    household: Mapped["Household"] = relationship()
+    household: Mapped["Household"] = relationship(lazy='raise')
     name: Mapped[str] = mapped_column(String(64))
     type: Mapped[FoodType] = mapped_column(nullable=False)
     serving_size: Mapped[float] = mapped_column(Float)
@@ -243,13 +339,22 @@ class MedicineMeta(db.Model):
     """Medicine metadata model storing information for medicine items."""
     uuid: Mapped[str] = mapped_column(String(64), primary_key=True)
     household_uuid: Mapped[str] = mapped_column(String(64), ForeignKey('household.uuid'))
-    household: Mapped["Household"] = relationship()
+    household: Mapped["Household"] = relationship(lazy='raise')
     name: Mapped[str] = mapped_column(String(64))
     archived: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
 
     def __repr__(self):
         return f"<MedicineMeta {self.name}>"
 
+class AppSession(db.Model):
+    """Server-side session data for the sqlalchemy session backend."""
+    sid: Mapped[str] = mapped_column(String(64), primary_key=True)
+    data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(nullable=False, index=True)
+
+    def __repr__(self):
+        return f"<AppSession {self.sid}>"
+
 ###############################################################
 
 def connect_to_db(app, db_uri=None):
@@ -1,13 +1,19 @@
+import cache
 import os
 import model
+import versions
 
 from datetime import datetime
 from dateutil import relativedelta
 from sqlalchemy import select
 from typing import Any
 
+@cache.household_cached('pets')
 def all(household_uuid: str) -> list[dict[str, Any]]:
   """Get all pets for a household.
+
+  Cached per household; anything that adds, edits or removes a pet must
+  call invalidate().
   
   Args:
     household_uuid: UUID of the household
@@ -16,23 +22,34 @@ def all(household_uuid: str) -> list[dict[str, Any]]:
     List of dictionaries containing pet id, name, and age
   """
   pet_data = model.db.session.execute(
-    select(model.Pet).where(model.Pet.household_uuid == household_uuid)
+    select(model.Pet.uuid, model.Pet.name, model.Pet.birthdate, model.Pet.photo_addr)
+    .where(model.Pet.household_uuid == household_uuid)
   ).all()
 
   pets = []
-  for row in pet_data:
-    for pet in row:
-      pets.append(
-          {
-            'id':  pet.uuid,
-            'name': pet.name,
-            'age': age(pet.birthdate),
-            'photo_addr': pet.photo_addr if pet.photo_addr else ''
-          }
-      )
+  for pet in pet_data:
+    pets.append(
+        {
+          'id':  pet.uuid,
+          'name': pet.name,
+          'age': age(pet.birthdate),
+          'photo_addr': pet.photo_addr if pet.photo_addr else ''
+        }
+    )
 
   return pets
 
+def invalidate(household_uuid: str) -> None:
+  """Drop the cached pet list for a household when a pet changes.
+
+  Call it in the transaction making the change; the cached list is dropped
+  when that commits.
+
+  Args:
+    household_uuid: UUID of the household
+  """
+  versions.bump(household_uuid)
+
 def age(birthdate):
   """Calculate and format pet age from birthdate.
   
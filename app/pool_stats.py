@@ -0,0 +1,112 @@
+import functools
+import model
+import threading
+import time
+
+from flask import Flask
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+from typing import Any
+
+
+class PoolStats:
+    """Counters describing how requests wait on the connection pool."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.overflow_events = 0
+        self.timeouts = 0
+
+    def record_checkout(self, wait: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.wait_seconds_total += wait
+            self.wait_seconds_max = max(self.wait_seconds_max, wait)
+
+    def record_overflow(self) -> None:
+        with self._lock:
+            self.overflow_events += 1
+
+    def record_timeout(self, wait: float) -> None:
+        with self._lock:
+            self.timeouts += 1
+            self.wait_seconds_total += wait
+            self.wait_seconds_max = max(self.wait_seconds_max, wait)
+
+
+stats = PoolStats()
+
+
+def instrument(engine: Engine) -> None:
+    """Record checkout waits, overflow and timeouts for an engine's pool.
+
+    Sessions check connections out through engine.connect(), so the wait
+    is timed around it. Overflow is counted from the pool's connect event,
+    which fires for each new connection; those opened beyond pool_size are
+    overflow. The listener follows the engine, so it survives the pool
+    being recreated by engine.dispose() after a fork.
+
+    Args:
+        engine: Engine whose connections to measure
+    """
+    connect = engine.connect
+
+    @functools.wraps(connect)
+    def timed_connect(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            connection = connect(*args, **kwargs)
+        except PoolTimeoutError:
+            stats.record_timeout(time.perf_counter() - start)
+            raise
+        stats.record_checkout(time.perf_counter() - start)
+        return connection
+
+    engine.connect = timed_connect
+
+    @event.listens_for(engine, 'connect')
+    def _connect(dbapi_connection, connection_record):
+        if isinstance(engine.pool, QueuePool) and engine.pool.overflow() > 0:
+            stats.record_overflow()
+
+
+def snapshot(pool: Any) -> dict[str, Any]:
+    """Get current pool state and cumulative checkout statistics.
+
+    Args:
+        pool: The engine's connection pool
+
+    Returns:
+        Dictionary of pool metrics
+    """
+    data: dict[str, Any] = {
+        'checkouts': stats.checkouts,
+        'wait_seconds_total': round(stats.wait_seconds_total, 6),
+        'wait_seconds_max': round(stats.wait_seconds_max, 6),
+        'wait_seconds_avg': round(stats.wait_seconds_total / stats.checkouts, 6) if stats.checkouts else 0.0,
+        'overflow_events': stats.overflow_events,
+        'timeouts': stats.timeouts,
+    }
+    if isinstance(pool, QueuePool):
+        data.update({
+            'size': pool.size(),
+            'checked_in': pool.checkedin(),
+            'checked_out': pool.checkedout(),
+            'overflow': pool.overflow(),
+        })
+    return data
+
+
+def init_app(app: Flask) -> None:
+    """Instrument the app's database engine.
+
+    Args:
+        app: Flask application
+    """
+    with app.app_context():
+        instrument(model.db.engine)
@@ -0,0 +1,115 @@
+import threading
+import time
+
+from flask import Flask, before_render_template, g, request, template_rendered
+from flask_sqlalchemy.record_queries import get_recorded_queries
+from typing import Any
+
+# Upper bounds (milliseconds) of the request latency histogram buckets
+BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, float('inf'))
+# Slowest statements kept per request and per route
+SLOWEST = 5
+
+
+class RouteStats:
+    """Aggregated timings for one endpoint."""
+
+    def __init__(self):
+        self.requests = 0
+        self.total_ms = 0.0
+        self.db_ms = 0.0
+        self.render_ms = 0.0
+        self.statements = 0
+        self.buckets = [0] * len(BUCKETS_MS)
+        self.slowest: list[dict[str, Any]] = []
+
+    def record(self, total_ms: float, db_ms: float, render_ms: float, statements: int,
+               slowest: list[dict[str, Any]]) -> None:
+        self.requests += 1
+        self.total_ms += total_ms
+        self.db_ms += db_ms
+        self.render_ms += render_ms
+        self.statements += statements
+        self.buckets[next(i for i, bound in enumerate(BUCKETS_MS) if total_ms <= bound)] += 1
+        self.slowest = sorted(self.slowest + slowest, key=lambda q: q['duration_ms'], reverse=True)[:SLOWEST]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'requests': self.requests,
+            'avg_ms': round(self.total_ms / self.requests, 3),
+            'avg_db_ms': round(self.db_ms / self.requests, 3),
+            'avg_render_ms': round(self.render_ms / self.requests, 3),
+            'avg_statements': round(self.statements / self.requests, 2),
+            'histogram_ms': {('+Inf' if bound == float('inf') else str(bound)): count
+                             for bound, count in zip(BUCKETS_MS, self.buckets)},
+            'slowest_statements': self.slowest,
+        }
+
+
+_lock = threading.Lock()
+_routes: dict[str, RouteStats] = {}
+
+
+def _start_render(sender, template, context, **extra) -> None:
+    g.perf_render_start = time.perf_counter()
+
+
+def _end_render(sender, template, context, **extra) -> None:
+    start = g.pop('perf_render_start', None)
+    if start is not None:
+        g.perf_render_ms = g.get('perf_render_ms', 0.0) + (time.perf_counter() - start) * 1000
+
+
+def _before_request() -> None:
+    g.perf_start = time.perf_counter()
+    g.perf_query_index = len(get_recorded_queries())
+
+
+def _after_request(response):
+    if 'perf_start' not in g:
+        return response
+
+    total_ms = (time.perf_counter() - g.perf_start) * 1000
+    queries = get_recorded_queries()[g.perf_query_index:]
+    db_ms = sum(query.duration for query in queries) * 1000
+    render_ms = g.get('perf_render_ms', 0.0)
+    slowest = [
+        {
+            'statement': query.statement,
+            'duration_ms': round(query.duration * 1000, 3),
+        }
+        for query in sorted(queries, key=lambda q: q.duration, reverse=True)[:SLOWEST]
+    ]
+
+    response.headers.add(
+        'Server-Timing',
+        f'db;dur={db_ms:.2f};desc="{len(queries)} statements", render;dur={render_ms:.2f}, total;dur={total_ms:.2f}'
+    )
+
+    endpoint = request.endpoint or 'unmatched'
+    with _lock:
+        _routes.setdefault(endpoint, RouteStats()).record(total_ms, db_ms, render_ms, len(queries), slowest)
+    return response
+
+
+def snapshot() -> dict[str, Any]:
+    """Get aggregated timings per endpoint for this worker process."""
+    with _lock:
+        return {endpoint: stats.to_dict() for endpoint, stats in sorted(_routes.items())}
+
+
+def init_app(app: Flask) -> None:
+    """Install the profiling hooks if PROFILING_ENABLED is set.
+
+    Must run before other before_request hooks are registered so the timing
+    covers them too.
+
+    Args:
+        app: Flask application
+    """
+    if not app.config['PROFILING_ENABLED']:
+        return
+    app.before_request(_before_request)
+    app.after_request(_after_request)
+    before_render_template.connect(_start_render, app)
+    template_rendered.connect(_end_render, app)
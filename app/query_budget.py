@@ -0,0 +1,50 @@
+import functools
+import logging
+import model
+
+from flask import request
+from flask_sqlalchemy.record_queries import get_recorded_queries
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised when a route issues more SQL statements than its budget allows."""
+
+
+def query_budget(max_statements: int) -> Callable:
+    """Limit the number of SQL statements a GET view may issue.
+
+    Statements are counted from Flask-SQLAlchemy's recorded queries
+    (SQLALCHEMY_RECORD_QUERIES), covering only the view itself. When
+    QUERY_BUDGET_ENFORCE is set (it defaults to FLASK_DEBUG) an
+    overrun raises QueryBudgetExceeded, so a test hitting the route fails;
+    otherwise it is logged as a warning. The budget is kept on the view as
+    max_statements so tests can find every budgeted route.
+
+    Args:
+        max_statements: Maximum statements for one GET request to the view
+    """
+    def decorator(view: Callable) -> Callable:
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.method != 'GET':
+                return view(*args, **kwargs)
+
+            before = len(get_recorded_queries())
+            response = view(*args, **kwargs)
+            statements = get_recorded_queries()[before:]
+            if len(statements) > max_statements:
+                message = (f'{request.endpoint} issued {len(statements)} SQL statements '
+                           f'(budget {max_statements}): '
+                           + '; '.join(query.statement for query in statements))
+                if model.app.config['QUERY_BUDGET_ENFORCE']:
+                    raise QueryBudgetExceeded(message)
+                logger.warning(message)
+            return response
+
+        wrapper.max_statements = max_statements
+        return wrapper
+
+    return decorator
@@ -0,0 +1,162 @@
+import model
+
+from datetime import date
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from typing import Any, Optional
+
+_ROLLUP_COLUMNS = ['household_uuid', 'day', 'pet_uuid', 'type', 'calories', 'event_count']
+_LATEST_COLUMNS = ['household_uuid', 'type', 'pet_uuid', 'event_id', 'timestamp']
+
+
+def local_day(column):
+    """SQL expression bucketing a timestamptz column into its APP_TIMEZONE calendar date."""
+    return func.date(func.timezone(model.APP_TIMEZONE.zone, column))
+
+
+def _rollup_rows():
+    """Select per-(household, day, pet, type) totals from raw events."""
+    day = local_day(model.Event.timestamp)
+    return (select(model.Event.household_uuid, day, model.Event.pet_uuid, model.Event.type,
+                   func.coalesce(func.sum(model.FoodEvent.calories), 0), func.count(model.Event.id))
+            .join(model.FoodEvent, isouter=True)
+            .group_by(model.Event.household_uuid, day, model.Event.pet_uuid, model.Event.type))
+
+
+def _latest_rows():
+    """Select the newest event for each (household, type, pet) from raw events."""
+    return (select(model.Event.household_uuid, model.Event.type, model.Event.pet_uuid,
+                   model.Event.id, model.Event.timestamp)
+            .distinct(model.Event.household_uuid, model.Event.type, model.Event.pet_uuid)
+            .order_by(model.Event.household_uuid, model.Event.type, model.Event.pet_uuid,
+                      model.Event.timestamp.desc(), model.Event.id.desc()))
+
+
+def record(event_ids: list[int]) -> None:
+    """Add newly created events to their days' rollup rows.
+
+    The events and their metadata must already be flushed. Days are derived
+    from the stored timestamps in SQL, so they match how history is bucketed.
+    The caller is responsible for committing, keeping the rollup in the same
+    transaction as the events themselves.
+
+    Args:
+        event_ids: IDs of the new events
+    """
+    stmt = insert(model.DailyPetRollup).from_select(
+        _ROLLUP_COLUMNS, _rollup_rows().where(model.Event.id.in_(event_ids)))
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['household_uuid', 'day', 'pet_uuid', 'type'],
+        set_={
+            'calories': model.DailyPetRollup.calories + stmt.excluded.calories,
+            'event_count': model.DailyPetRollup.event_count + stmt.excluded.event_count,
+        }
+    )
+    model.db.session.execute(stmt)
+
+
+def record_latest(event_ids: list[int]) -> None:
+    """Point each new event's (type, pet) slot at it if it is the newest.
+
+    Backdated events leave a newer pointer untouched. As with record(), the
+    caller commits.
+
+    Args:
+        event_ids: IDs of the new events
+    """
+    stmt = insert(model.LatestEvent).from_select(
+        _LATEST_COLUMNS, _latest_rows().where(model.Event.id.in_(event_ids)))
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['household_uuid', 'type', 'pet_uuid'],
+        set_={'event_id': stmt.excluded.event_id, 'timestamp': stmt.excluded.timestamp},
+        where=model.LatestEvent.timestamp <= stmt.excluded.timestamp,
+    )
+    model.db.session.execute(stmt)
+
+
+def rebuild(household_uuid: Optional[str] = None) -> None:
+    """Rebuild rollup and latest-event rows from the raw event history.
+
+    Args:
+        household_uuid: Only rebuild this household, or every household if None
+    """
+    rows = _rollup_rows()
+    latest = _latest_rows()
+    clear = delete(model.DailyPetRollup)
+    clear_latest = delete(model.LatestEvent)
+    if household_uuid:
+        rows = rows.where(model.Event.household_uuid == household_uuid)
+        latest = latest.where(model.Event.household_uuid == household_uuid)
+        clear = clear.where(model.DailyPetRollup.household_uuid == household_uuid)
+        clear_latest = clear_latest.where(model.LatestEvent.household_uuid == household_uuid)
+
+    try:
+        model.db.session.execute(clear)
+        model.db.session.execute(insert(model.DailyPetRollup).from_select(_ROLLUP_COLUMNS, rows))
+        model.db.session.execute(clear_latest)
+        model.db.session.execute(insert(model.LatestEvent).from_select(_LATEST_COLUMNS, latest))
+        model.db.session.commit()
+    except Exception:
+        model.db.session.rollback()
+        raise
+
+
+def totals_query(household_uuid: str, first_day: Any, last_day: Any):
+    """Build the per-day, per-type, per-pet totals query for a range of days.
+
+    Args:
+        household_uuid: UUID of the household
+        first_day: Inclusive first day (date or SQL expression)
+        last_day: Inclusive last day (date or SQL expression)
+    """
+    pet_name = func.coalesce(model.Pet.name, '').label('pet_name')
+    pet_icon = func.coalesce(model.Pet.photo_addr, '').label('pet_icon')
+    return (select(model.DailyPetRollup.day, model.DailyPetRollup.type, pet_name, pet_icon,
+                   func.sum(model.DailyPetRollup.calories), func.sum(model.DailyPetRollup.event_count))
+            .join(model.Pet, isouter=True)
+            .where(model.DailyPetRollup.household_uuid == household_uuid)
+            .where(model.DailyPetRollup.day >= first_day)
+            .where(model.DailyPetRollup.day <= last_day)
+            .group_by(model.DailyPetRollup.day, model.DailyPetRollup.type, pet_name, pet_icon))
+
+
+def collect_totals(rows: Any) -> dict[date, dict[str, Any]]:
+    """Group the rows of totals_query by day.
+
+    Food events are totalled by calories; all other event types by count.
+
+    Args:
+        rows: Result rows of totals_query
+
+    Returns:
+        Dictionary mapping dates to event-type dictionaries keyed by (pet_name, pet_icon)
+    """
+    day_totals: dict[date, dict[str, Any]] = {}
+    for day, event_type, name, icon, calories, count in rows:
+        event_data = day_totals.setdefault(day, {'Food': {}, 'Litter': {}, 'Medicine': {}, 'Vitals': {}})
+        if event_type == model.EventType.Food:
+            event_data['Food'][(name, icon)] = float(calories)
+        else:
+            event_data[event_type.name][(name, icon)] = int(count)
+
+    return day_totals
+
+
+def totals(household_uuid: str, first_day: Any, last_day: Any) -> dict[date, dict[str, Any]]:
+    """Get per-day, per-type, per-pet totals for a range of days.
+
+    Args:
+        household_uuid: UUID of the household
+        first_day: Inclusive first day (date or SQL expression)
+        last_day: Inclusive last day (date or SQL expression)
+
+    Returns:
+        Dictionary mapping dates to event-type dictionaries keyed by (pet_name, pet_icon)
+    """
+    return collect_totals(model.db.session.execute(totals_query(household_uuid, first_day, last_day)))
+
+
+if __name__ == "__main__":
+  with model.app.app_context():
+    rebuild()
+    print('Rebuilt daily_pet_rollup and latest_event')
@@ -1,33 +1,41 @@
-from typing import Any
+from dataclasses import dataclass
+from typing import ClassVar, Optional
 from flask import session
 import model
 from sqlalchemy import select
 
-def all() -> list[dict[str, Any]]:
+
+@dataclass(slots=True)
+class SavedEventRecord:
+    """A saved event shown as a quick event button on events.html."""
+    json_keys: ClassVar[dict[str, str]] = {'uuid': 'uuid', 'name': 'name', 'event_type': 'event-type',
+                                           'pet_name': 'pet-name', 'pet_icon': 'pet-icon', 'pet_uuid': 'pet-uuid'}
+    uuid: str
+    name: Optional[str]
+    event_type: str
+    pet_name: str
+    pet_icon: str
+    pet_uuid: Optional[str]
+
+
+def all() -> list[SavedEventRecord]:
     """Get all saved events for the current user's household.
     
     Returns:
-        List of dictionaries containing saved event information
+        List of saved event records
     """
     if not session.get('user') or not session.get('household'):
         return []
     
     household_uuid = session.get('household').uuid
     saved_events_raw = model.db.session.execute(
-        select(model.SavedEvent, model.Pet)
+        select(model.SavedEvent.uuid, model.SavedEvent.name, model.SavedEvent.type,
+               model.Pet.uuid.label('pet_uuid'), model.Pet.name.label('pet_name'), model.Pet.photo_addr)
         .join(model.Pet, isouter=True)
         .where(model.SavedEvent.household_uuid == household_uuid)
     ).all()
 
-    event_data = []
-    for event, pet in saved_events_raw:
-        event_data.append({
-            'uuid': event.uuid,
-            'name': event.name,
-            'event-type': event.type.name,
-            'pet-name': pet.name if pet and pet.name else '',
-            'pet-icon': pet.photo_addr if pet and pet.photo_addr else '',
-            'pet-uuid': pet.uuid if pet and pet.uuid else None,
-        })
-
-    return event_data
+    return [
+        SavedEventRecord(event_uuid, name, event_type.name, pet_name or '', photo_addr or '', pet_uuid)
+        for event_uuid, name, event_type, pet_uuid, pet_name, photo_addr in saved_events_raw
+    ]
@@ -1,20 +1,46 @@
+import cache
+import compression
+import functools
+import io
 import os
 import events
+import export
+import fanout
+import fragments
 import foods
+import importer
+import json_provider
 import medicine
+import metrics
 import model
 import pets
+import pool_stats
+import profiling
+import query_budget
 import saved_events
+import sessions
+import trends
 import users
+import versions
 
-from datetime import datetime
-from flask import redirect, render_template, request, session, send_from_directory, jsonify
+from datetime import datetime, timedelta
+from flask import Response, redirect, render_template, request, session, send_from_directory, jsonify, stream_template, stream_with_context
 from sqlalchemy import select
 from urllib.parse import quote
 
 
+# Clients allowed to read /debug/perf
+LOOPBACK_ADDRESSES = {'127.0.0.1', '::1'}
+
 app = model.app
 app.secret_key = 'BAD_SECRET_KEY'
+json_provider.init_app(app)
+compression.init_app(app)
+sessions.init_app(app)
+profiling.init_app(app)
+metrics.init_app(app)
+pool_stats.init_app(app)
+fragments.init_app(app)
 
 @app.before_request
 def load_user_and_household():
@@ -24,8 +50,8 @@ def load_user_and_household():
     data is available. If no email is in session, redirects to login.
     Handles login POST requests by setting session email from form data.
     """
-    # Skip authentication for static files and assets
-    if request.path.startswith('/css/') or request.path.startswith('/assets/'):
+    # Skip authentication for static files, assets and the metrics scrape
+    if request.path.startswith('/css/') or request.path.startswith('/assets/') or request.path == '/metrics':
         return None
     
     # Handle login POST request
@@ -40,12 +66,14 @@ def load_user_and_household():
     if not session.get('email'):
         return render_template("login.html")
 
-    session['user'] = users.get_user(session.get('email', None))
+    # Compact records (not ORM objects) are cached per email and kept in the session
+    user, household = users.get_identity(session.get('email'))
+    session['user'] = user
     if not session.get('user'):
         session.pop('email', None)  # Clear invalid email from session
         return render_template("login.html", error="User not found")
     
-    session['household'] = users.get_household(session.get('user'))
+    session['household'] = household
     if not session.get('household'):
         session.pop('email', None)  # Clear email if no household
         return render_template("login.html", error="No household found for user")
@@ -53,6 +81,8 @@ def load_user_and_household():
 #####################################################
 
 @app.route('/', methods=['GET', 'POST'])
+@versions.conditional(timedelta(minutes=1))
+@query_budget.query_budget(2)
 def show_events():
     """Events route.
     
@@ -72,15 +102,13 @@ def show_events():
     match request.method:
         case 'GET':
             try:
-                events_data = events.summary()
-                quick_events_data = saved_events.all()
+                events_data, quick_events_data = fanout.gather(events.summary, saved_events.all)
                 household_name = household.name
                 # Get error or success message from query parameters
                 error = request.args.get('error')
                 created = request.args.get('created')
                 return render_template("events.html", events=events_data, quick_events=quick_events_data, household_name=household_name, error=error, created=created)
             except Exception as e:
-                breakpoint()
                 return render_template("events.html", events=[], quick_events=[], household_name=household.name, error="Error loading events")
                 
         case 'POST':
@@ -103,8 +131,8 @@ def show_events():
                     # Convert saved event metadata to the format expected by events.new()
                     event_data = {}
 
-                    # Only set pet for Food and Medicine events (matching _create_event_base behavior)
-                    if saved_event.pet_uuid and saved_event.type in [model.EventType.Food, model.EventType.Medicine]:
+                    # Only set pet for Food, Medicine and Vitals events (matching _create_event_base behavior)
+                    if saved_event.pet_uuid and saved_event.type in [model.EventType.Food, model.EventType.Medicine, model.EventType.Vitals]:
                         event_data['pet'] = saved_event.pet_uuid
 
                     # Convert meta to the expected format based on event type
@@ -226,9 +254,14 @@ def show_saved_events():
     return redirect("/")
 
 @app.route('/events/all', methods=['GET'])
+@versions.conditional()
+@query_budget.query_budget(2)
 def show_events_all():
   """
-  GET: show all events
+  GET: show all events, one page at a time
+  Query params:
+      - cursor: cursor for the next page, from the "Older Events" link
+      - stream: if set, stream the entire history in a single response
   """
   user = session.get('user')
   household = session.get('household')
@@ -237,17 +270,25 @@ def show_events_all():
       return redirect("/")
   
   try:
-      events_data = events.all_events()
       pets_data = pets.all(household.uuid)
       household_name = household.name
       error = request.args.get('error')
       created = request.args.get('created')
-      return render_template("events_all.html", events=events_data, pets=pets_data, household_name=household_name, error=error, created=created)
+      if request.args.get('stream'):
+          # Rows are pulled from the database as the template renders them
+          return Response(stream_with_context(stream_template(
+              "events_all.html", events=events.stream_events(), pets=pets_data, household_name=household_name,
+              error=error, created=created, next_cursor=None, stream=True)), mimetype='text/html')
+
+      events_data, next_cursor = events.all_events(cursor=request.args.get('cursor'))
+      return render_template("events_all.html", events=events_data, pets=pets_data, household_name=household_name, error=error, created=created, next_cursor=next_cursor)
   except Exception as e:
       return render_template("events_all.html", events=[], pets=[], household_name=household.name, error="Error loading events")
 
 
 @app.route('/events/day', methods=['GET'])
+@versions.conditional()
+@query_budget.query_budget(2)
 def show_events_day():
     """Day view route.
     
@@ -268,6 +309,8 @@ def show_events_day():
 
 
 @app.route('/api/events/days', methods=['GET'])
+@versions.conditional()
+@query_budget.query_budget(1)
 def api_events_days():
     """API endpoint for infinite scroll.
     
@@ -298,7 +341,154 @@ def api_events_days():
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/api/events/summary', methods=['GET'])
+@versions.conditional(timedelta(minutes=1))
+@query_budget.query_budget(1)
+def api_events_summary():
+    """JSON version of the home page summary.
+
+    GET: returns JSON with the latest event of each type for each pet
+    """
+    household = session.get('household')
+    if not household:
+        return jsonify({'error': 'Not authenticated'}), 401
+
+    try:
+        return jsonify({'events': events.summary()})
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/events/all', methods=['GET'])
+@versions.conditional()
+@query_budget.query_budget(1)
+def api_events_all():
+    """JSON version of /events/all.
+
+    GET: returns JSON with one page of events, newest first
+    Query params:
+        - cursor: next_cursor from the previous page
+        - limit: number of events to return, 1 to events.PAGE_SIZE, defaults to events.PAGE_SIZE
+    """
+    household = session.get('household')
+    if not household:
+        return jsonify({'error': 'Not authenticated'}), 401
+
+    try:
+        limit = max(1, min(int(request.args.get('limit', events.PAGE_SIZE)), events.PAGE_SIZE))
+        events_data, next_cursor = events.all_events(cursor=request.args.get('cursor'), limit=limit)
+        return jsonify({'events': events_data, 'next_cursor': next_cursor})
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/events/bulk', methods=['POST'])
+def api_events_bulk():
+    """API endpoint for bulk event ingestion.
+
+    POST: create many events in one transaction. The JSON body is
+    {"events": [...]}, where each event has a "type" (name or number), an
+    optional ISO "timestamp" and the same fields as the new event form.
+    Invalid events are reported by index and skipped; the rest are created.
+    """
+    household = session.get('household')
+    user = session.get('user')
+    if not household or not user:
+        return jsonify({'error': 'Not authenticated'}), 401
+
+    body = request.get_json(silent=True)
+    items = body.get('events') if isinstance(body, dict) else None
+    if not isinstance(items, list):
+        return jsonify({'error': 'Expected a JSON object with an "events" list'}), 400
+    if len(items) > events.BULK_MAX_EVENTS:
+        return jsonify({'error': f'At most {events.BULK_MAX_EVENTS} events per request'}), 413
+
+    try:
+        created, errors = events.bulk_new(household.uuid, user.uuid, items)
+        return jsonify({'created': created, 'errors': errors}), 201 if created else 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/events/export', methods=['GET'])
+def api_events_export():
+    """API endpoint for exporting event history.
+
+    GET: streams the household's events, oldest first
+    Query params:
+        - format: "csv" (default) or "ndjson"
+        - start_date: first ISO date (YYYY-MM-DD) to include, defaults to the beginning
+        - end_date: last ISO date (YYYY-MM-DD) to include, defaults to the end
+        - pet: only include events for this pet UUID
+    """
+    household = session.get('household')
+    if not household:
+        return jsonify({'error': 'Not authenticated'}), 401
+
+    fmt = request.args.get('format', 'csv')
+    if fmt not in ('csv', 'ndjson'):
+        return jsonify({'error': 'format must be csv or ndjson'}), 400
+    try:
+        start = datetime.strptime(request.args['start_date'], '%Y-%m-%d').date() if request.args.get('start_date') else None
+        end = datetime.strptime(request.args['end_date'], '%Y-%m-%d').date() if request.args.get('end_date') else None
+    except ValueError:
+        return jsonify({'error': 'Dates must be YYYY-MM-DD'}), 400
+
+    data = export.rows(household.uuid, start, end, request.args.get('pet'))
+    if fmt == 'csv':
+        chunks, mimetype = export.csv_chunks(data), 'text/csv'
+    else:
+        chunks, mimetype = export.ndjson_chunks(data), 'application/x-ndjson'
+    return Response(
+        stream_with_context(chunks),
+        mimetype=mimetype,
+        headers={'Content-Disposition': f'attachment; filename=events.{fmt}'},
+    )
+
+
+@app.route('/api/events/import', methods=['POST'])
+def api_events_import():
+    """API endpoint for importing historical events from CSV.
+
+    POST: multipart upload with a "file" field. The header row names the
+    columns using the new event form's field names plus "type" and
+    "timestamp". Rows are parsed as they are read and committed in batches.
+    Query params:
+        - batch_size: rows per transaction, defaults to 500
+        - start_row: rows to skip, to resume from the "rows" of a failed import
+    """
+    household = session.get('household')
+    user = session.get('user')
+    if not household or not user:
+        return jsonify({'error': 'Not authenticated'}), 401
+
+    upload = request.files.get('file')
+    if not upload:
+        return jsonify({'error': 'Expected a CSV upload in the "file" field'}), 400
+    try:
+        batch_size = int(request.args.get('batch_size', importer.DEFAULT_BATCH_SIZE))
+        start_row = int(request.args.get('start_row', 0))
+    except ValueError:
+        return jsonify({'error': 'batch_size and start_row must be integers'}), 400
+    if batch_size < 1 or start_row < 0:
+        return jsonify({'error': 'batch_size must be at least 1 and start_row must not be negative'}), 400
+
+    checkpoint = {'rows': start_row}
+    try:
+        stream = io.TextIOWrapper(upload.stream, encoding='utf-8-sig', newline='')
+        summary = importer.import_rows(household.uuid, user.uuid, importer.reader(stream), batch_size, start_row,
+                                       on_checkpoint=lambda processed: checkpoint.update(rows=processed))
+        return jsonify(summary), 201 if summary['created'] else 400
+    except Exception as e:
+        # Batches before the failure are committed; resume with start_row=rows
+        return jsonify({'error': str(e), 'rows': checkpoint['rows']}), 500
+
+
 @app.route('/events/new')
+@versions.conditional(timedelta(minutes=1))
+@query_budget.query_budget(3)
 def new_event():
     """New event form route.
     
@@ -310,9 +500,11 @@ def new_event():
     
     try:
         now = datetime.now(tz=model.APP_TIMEZONE)
-        pets_data = pets.all(household.uuid)
-        foods_data = foods.all(household.uuid)
-        medicines_data = medicine.all(household.uuid)
+        pets_data, foods_data, medicines_data = fanout.gather(
+            functools.partial(pets.all, household.uuid),
+            functools.partial(foods.all, household.uuid),
+            functools.partial(medicine.all, household.uuid),
+        )
         event_types = [model.EventType.Food, model.EventType.Litter, model.EventType.Medicine, model.EventType.Vitals]
         return render_template(
             "new_event.html",
@@ -329,6 +521,8 @@ def new_event():
 
 
 @app.route('/pets', methods=['GET', 'POST'])
+@versions.conditional()
+@query_budget.query_budget(1)
 def view_pets():
     """Pets route.
     
@@ -347,16 +541,98 @@ def view_pets():
         return render_template("pets.html", pets=[], household_name=household.name, error="Error loading pets")
 
 
+@app.route('/api/pets/<pet_uuid>/trends', methods=['GET'])
+@versions.conditional()
+@query_budget.query_budget(3)
+def api_pet_trends(pet_uuid):
+    """Calorie and weight trends for one pet.
+
+    GET: returns JSON with bucketed calorie totals and weights, their
+    rolling averages and changes (see trends.trends)
+    Query params:
+        - start: ISO date string (YYYY-MM-DD), defaults to a year before end
+        - end: ISO date string (YYYY-MM-DD), defaults to today
+        - period: day, week or month, defaults to day
+        - window: number of buckets in the rolling averages, defaults to 7
+    """
+    household = session.get('household')
+    if not household:
+        return jsonify({'error': 'Not authenticated'}), 401
+    if not any(pet['id'] == pet_uuid for pet in pets.all(household.uuid)):
+        return jsonify({'error': 'Pet not found'}), 404
+
+    try:
+        end = request.args.get('end')
+        last_day = datetime.strptime(end, '%Y-%m-%d').date() if end else datetime.now(tz=model.APP_TIMEZONE).date()
+        start = request.args.get('start')
+        first_day = datetime.strptime(start, '%Y-%m-%d').date() if start else last_day - timedelta(days=365)
+        data = trends.trends(household.uuid, pet_uuid, first_day, last_day,
+                             period=request.args.get('period', 'day'),
+                             window=int(request.args.get('window', trends.DEFAULT_WINDOW)))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+    return jsonify(data)
+
+
 @app.route('/logout')
 def logout():
     """Log out the user.
     
     Clears session data and redirects to home.
     """
+    users.invalidate_identity(session.get('email'))
     session.clear()
     return redirect("/")
 
 
+@app.route('/debug/pool', methods=['GET'])
+def debug_pool():
+    """Connection pool metrics.
+
+    GET: returns JSON with pool size, checked-out connections, checkout wait
+    times, overflow events and pool timeouts for this worker process
+    """
+    return jsonify(pool_stats.snapshot(model.db.engine.pool))
+
+
+@app.route('/metrics', methods=['GET'])
+def prometheus_metrics():
+    """Prometheus scrape endpoint.
+
+    GET: request latency, in-flight requests, DB statement timings, pool,
+    read cache and event creation metrics, aggregated across workers when
+    PROMETHEUS_MULTIPROC_DIR is set
+    """
+    return metrics.render()
+
+
+@app.route('/debug/perf', methods=['GET'])
+def debug_perf():
+    """Per-route request profiling.
+
+    GET: returns JSON with latency histograms, average DB and template render
+    time, statement counts and the slowest statements (SQL text only, no
+    bound values) for each endpoint in this worker process. Requires
+    PROFILING_ENABLED, and only answers requests from the server itself,
+    since the statements cover every household.
+    """
+    if not app.config['PROFILING_ENABLED'] or request.remote_addr not in LOOPBACK_ADDRESSES:
+        return jsonify({'error': 'Profiling is disabled'}), 404
+    return jsonify(profiling.snapshot())
+
+
+@app.route('/debug/cache', methods=['GET'])
+def debug_cache():
+    """Household read cache metrics.
+
+    GET: returns JSON with hit and miss counts per cached namespace for this
+    worker process
+    """
+    return jsonify(cache.snapshot())
+
+
 @app.route('/assets/<path:filename>')
 def serve_assets(filename):
     """Serve static assets from the assets folder."""
@@ -0,0 +1,193 @@
+import hashlib
+import model
+import pickle
+import random
+import secrets
+
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from flask import Flask
+from flask.sessions import SessionInterface, SessionMixin
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert
+from typing import Any, Optional
+from werkzeug.datastructures import CallbackDict
+
+# Chance that a SQLStore write also deletes a batch of expired sessions
+PURGE_PROBABILITY = 0.01
+PURGE_BATCH_SIZE = 1000
+
+
+class ServerSideSession(CallbackDict, SessionMixin):
+    """Session dictionary whose contents live in a server-side store."""
+
+    def __init__(self, initial: Optional[dict[str, Any]] = None, sid: Optional[str] = None,
+                 new: bool = False, digest: Optional[bytes] = None, expires_at: Optional[datetime] = None):
+        def on_update(self):
+            self.modified = True
+
+        super().__init__(initial, on_update)
+        self.sid = sid
+        self.new = new
+        self.digest = digest  # Hash of the data as loaded, used to skip unchanged writes
+        self.expires_at = expires_at  # Stored expiry as loaded, used to decide when to extend it
+        self.modified = False
+
+
+class MemoryStore:
+    """In-process LRU session store for single-node deployments.
+
+    Relies on OrderedDict operations being atomic under the GIL rather than
+    taking a lock; a lost move_to_end race only affects eviction order.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[datetime, bytes]] = OrderedDict()
+
+    def get(self, sid: str) -> Optional[tuple[bytes, datetime]]:
+        entry = self._entries.get(sid)
+        if entry is None:
+            return None
+        expires_at, data = entry
+        if expires_at <= datetime.now(timezone.utc):
+            self._entries.pop(sid, None)
+            return None
+        try:
+            self._entries.move_to_end(sid)
+        except KeyError:
+            pass  # Evicted or deleted by another thread in the meantime
+        return data, expires_at
+
+    def set(self, sid: str, data: bytes, expires_at: datetime) -> None:
+        self._entries[sid] = (expires_at, data)
+        self._entries.move_to_end(sid)
+        while len(self._entries) > self.max_entries:
+            try:
+                self._entries.popitem(last=False)
+            except KeyError:
+                break
+
+    def touch(self, sid: str, expires_at: datetime) -> None:
+        entry = self._entries.get(sid)
+        if entry is not None:
+            self._entries[sid] = (expires_at, entry[1])
+
+    def delete(self, sid: str) -> None:
+        self._entries.pop(sid, None)
+
+
+class SQLStore:
+    """Postgres-backed session store shared by every worker and container.
+
+    Expired rows are never read. About one write in 1/PURGE_PROBABILITY
+    also deletes up to PURGE_BATCH_SIZE of them, so the table stays
+    bounded without a separate cleanup job.
+    """
+
+    def get(self, sid: str) -> Optional[tuple[bytes, datetime]]:
+        with model.db.engine.connect() as conn:
+            row = conn.execute(
+                select(model.AppSession.data, model.AppSession.expires_at)
+                .where(model.AppSession.sid == sid)
+                .where(model.AppSession.expires_at > datetime.now(timezone.utc))
+            ).one_or_none()
+        return tuple(row) if row else None
+
+    def set(self, sid: str, data: bytes, expires_at: datetime) -> None:
+        stmt = insert(model.AppSession).values(sid=sid, data=data, expires_at=expires_at)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['sid'],
+            set_={'data': stmt.excluded.data, 'expires_at': stmt.excluded.expires_at},
+        )
+        with model.db.engine.begin() as conn:
+            conn.execute(stmt)
+            if random.random() < PURGE_PROBABILITY:
+                self._purge(conn)
+
+    def touch(self, sid: str, expires_at: datetime) -> None:
+        with model.db.engine.begin() as conn:
+            conn.execute(update(model.AppSession).where(model.AppSession.sid == sid).values(expires_at=expires_at))
+
+    def _purge(self, conn) -> None:
+        expired = (select(model.AppSession.sid)
+                   .where(model.AppSession.expires_at <= datetime.now(timezone.utc))
+                   .limit(PURGE_BATCH_SIZE))
+        conn.execute(delete(model.AppSession).where(model.AppSession.sid.in_(expired)))
+
+    def delete(self, sid: str) -> None:
+        with model.db.engine.begin() as conn:
+            conn.execute(delete(model.AppSession).where(model.AppSession.sid == sid))
+
+
+class ServerSideSessionInterface(SessionInterface):
+    """Flask session interface keeping only an opaque session ID in the cookie.
+
+    Session data is pickled into the configured store. A write is skipped
+    when the pickled data hashes the same as it did when the session was
+    opened, so requests that reassign identical values cost no store I/O;
+    the stored expiry is still extended, with a data-free touch, once it is
+    SESSION_REFRESH_INTERVAL behind where a write now would put it.
+    """
+
+    def __init__(self, store: Any):
+        self.store = store
+
+    def _lifetime(self, app: Flask) -> timedelta:
+        return app.permanent_session_lifetime
+
+    def open_session(self, app: Flask, request) -> ServerSideSession:
+        sid = request.cookies.get(self.get_cookie_name(app))
+        if sid:
+            entry = self.store.get(sid)
+            if entry is not None:
+                data, expires_at = entry
+                return ServerSideSession(pickle.loads(data), sid=sid, digest=hashlib.sha1(data).digest(),
+                                         expires_at=expires_at)
+        return ServerSideSession(sid=secrets.token_urlsafe(32), new=True)
+
+    def save_session(self, app: Flask, session: ServerSideSession, response) -> None:
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+
+        if not session:
+            if session.modified and not session.new:
+                self.store.delete(session.sid)
+                response.delete_cookie(name, domain=domain, path=path)
+            return
+
+        data = pickle.dumps(dict(session), protocol=pickle.HIGHEST_PROTOCOL)
+        expires_at = datetime.now(timezone.utc) + self._lifetime(app)
+        if hashlib.sha1(data).digest() != session.digest:
+            self.store.set(session.sid, data, expires_at)
+        elif session.expires_at < expires_at - timedelta(seconds=app.config["SESSION_REFRESH_INTERVAL"]):
+            self.store.touch(session.sid, expires_at)
+
+        if session.new or self.should_set_cookie(app, session):
+            response.set_cookie(
+                name,
+                session.sid,
+                expires=self.get_expiration_time(app, session),
+                httponly=self.get_cookie_httponly(app),
+                domain=domain,
+                path=path,
+                secure=self.get_cookie_secure(app),
+                samesite=self.get_cookie_samesite(app),
+            )
+
+
+def init_app(app: Flask) -> None:
+    """Install the session backend selected by SESSION_TYPE.
+
+    "memory" uses the in-process LRU store and "sqlalchemy" the shared
+    Postgres table; "filesystem" keeps the Flask-Session setup from model.py.
+
+    Args:
+        app: Flask application
+    """
+    match app.config["SESSION_TYPE"]:
+        case "memory":
+            app.session_interface = ServerSideSessionInterface(MemoryStore(app.config["SESSION_MEMORY_MAX_ENTRIES"]))
+        case "sqlalchemy":
+            app.session_interface = ServerSideSessionInterface(SQLStore())
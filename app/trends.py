@@ -0,0 +1,144 @@
+import model
+
+from datetime import date, datetime, time, timedelta
+from sqlalchemy import DateTime, Interval, cast, extract, func, literal, select
+from typing import Any
+
+# Bucket lengths accepted by trends(), as Postgres date_trunc fields
+PERIODS = ('day', 'week', 'month')
+# Default number of buckets in the rolling averages
+DEFAULT_WINDOW = 7
+
+
+def _calorie_series(household_uuid: str, pet_uuid: str, period: str, window: int,
+                    first_day: date, last_day: date):
+    """Build the calorie totals query: one row per bucket, empty buckets included.
+
+    Totals come from daily_pet_rollup. Buckets are generated with
+    generate_series so the rolling average and change are taken over
+    consecutive buckets rather than over only the buckets with food.
+    """
+    rollup = model.DailyPetRollup
+    bucket = func.date_trunc(period, cast(rollup.day, DateTime)).label('bucket')
+    totals = (select(bucket, func.sum(rollup.calories).label('total'))
+              .where(rollup.household_uuid == household_uuid)
+              .where(rollup.pet_uuid == pet_uuid)
+              .where(rollup.type == model.EventType.Food)
+              .where(rollup.day >= first_day)
+              .where(rollup.day <= last_day)
+              .group_by(bucket)
+              .subquery())
+    series = func.generate_series(
+        func.date_trunc(period, cast(first_day, DateTime)),
+        func.date_trunc(period, cast(last_day, DateTime)),
+        cast(literal(f'1 {period}'), Interval),
+    ).table_valued('bucket').render_derived()
+
+    total = func.coalesce(totals.c.total, 0)
+    ordered = {'order_by': series.c.bucket}
+    return (select(series.c.bucket, total.label('total'),
+                   func.avg(total).over(rows=(-(window - 1), 0), **ordered).label('rolling_avg'),
+                   (total - func.lag(total).over(**ordered)).label('change'))
+            .select_from(series.outerjoin(totals, totals.c.bucket == series.c.bucket))
+            .order_by(series.c.bucket))
+
+
+def _weight_series(household_uuid: str, pet_uuid: str, period: str, window: int,
+                   first_day: date, last_day: date):
+    """Build the weight query: the mean weight of each bucket that has one.
+
+    The rolling average covers the last window measured buckets, and the
+    change is per day between consecutive measured buckets, so gaps in
+    weighing do not read as drops to zero.
+    """
+    start = model.APP_TIMEZONE.localize(datetime.combine(first_day, time.min))
+    end = model.APP_TIMEZONE.localize(datetime.combine(last_day + timedelta(days=1), time.min))
+    bucket = func.date_trunc(period, func.timezone(model.APP_TIMEZONE.zone, model.Event.timestamp)).label('bucket')
+    weights = (select(bucket, func.avg(model.VitalsEvent.value).label('value'))
+               .join(model.Event, model.VitalsEvent.event_id == model.Event.id)
+               .where(model.Event.household_uuid == household_uuid)
+               .where(model.Event.type == model.EventType.Vitals)
+               .where(model.Event.pet_uuid == pet_uuid)
+               .where(model.Event.timestamp >= start)
+               .where(model.Event.timestamp < end)
+               .where(model.VitalsEvent.type == model.VitalsType.Weight)
+               .group_by(bucket)
+               .subquery())
+
+    ordered = {'order_by': weights.c.bucket}
+    days_between = extract('epoch', weights.c.bucket - func.lag(weights.c.bucket).over(**ordered)) / 86400
+    return (select(weights.c.bucket, weights.c.value,
+                   func.avg(weights.c.value).over(rows=(-(window - 1), 0), **ordered).label('rolling_avg'),
+                   ((weights.c.value - func.lag(weights.c.value).over(**ordered))
+                    / func.nullif(days_between, 0)).label('change_per_day'))
+            .order_by(weights.c.bucket))
+
+
+def _bucket_start(day: date, period: str) -> date:
+    """Get the first day of the bucket containing day, matching Postgres date_trunc."""
+    match period:
+        case 'week':
+            return day - timedelta(days=day.weekday())
+        case 'month':
+            return day.replace(day=1)
+    return day
+
+
+def _round(value: Any, digits: int = 2) -> Any:
+    return None if value is None else round(float(value), digits)
+
+
+def trends(household_uuid: str, pet_uuid: str, first_day: date, last_day: date,
+           period: str = 'day', window: int = DEFAULT_WINDOW) -> dict[str, Any]:
+    """Get a pet's calorie intake and weight series for a range of days.
+
+    Bucketing, rolling averages and changes are computed in Postgres with
+    window functions, one statement per series; the rows returned are
+    already the final series.
+
+    Args:
+        household_uuid: UUID of the household
+        pet_uuid: UUID of the pet
+        first_day: Inclusive first APP_TIMEZONE day; moved back to the start of its bucket
+        last_day: Inclusive last APP_TIMEZONE day
+        period: Bucket length, one of PERIODS
+        window: Number of buckets in the rolling averages
+
+    Returns:
+        Dictionary with the request parameters, a 'calories' list of
+        {'bucket', 'total', 'rolling_avg', 'change'} and a 'weight' list of
+        {'bucket', 'value', 'rolling_avg', 'change_per_day'}
+
+    Raises:
+        ValueError: If the period, window or range is invalid
+    """
+    if period not in PERIODS:
+        raise ValueError(f'period must be one of {", ".join(PERIODS)}')
+    if window < 1:
+        raise ValueError('window must be at least 1')
+    if first_day > last_day:
+        raise ValueError('start must not be after end')
+
+    # Widen the range to whole buckets so the first bucket is not a partial sum
+    first_day = _bucket_start(first_day, period)
+    args = (household_uuid, pet_uuid, period, window, first_day, last_day)
+    calories = model.db.session.execute(_calorie_series(*args)).all()
+    weight = model.db.session.execute(_weight_series(*args)).all()
+
+    return {
+        'pet': pet_uuid,
+        'period': period,
+        'window': window,
+        'start': first_day.isoformat(),
+        'end': last_day.isoformat(),
+        'calories': [
+            {'bucket': bucket.date().isoformat(), 'total': int(total),
+             'rolling_avg': _round(rolling_avg), 'change': None if change is None else int(change)}
+            for bucket, total, rolling_avg, change in calories
+        ],
+        'weight': [
+            {'bucket': bucket.date().isoformat(), 'value': _round(value, 3),
+             'rolling_avg': _round(rolling_avg, 3), 'change_per_day': _round(change_per_day, 4)}
+            for bucket, value, rolling_avg, change_per_day in weight
+        ],
+    }
@@ -1,8 +1,27 @@
 import model
+import time
 
 from flask import session
 from sqlalchemy import select
-from typing import Optional
+from typing import NamedTuple, Optional
+
+
+class UserRecord(NamedTuple):
+    """Compact, session-safe copy of an AppUser."""
+    uuid: str
+    name: str
+    email: str
+
+
+class HouseholdRecord(NamedTuple):
+    """Compact, session-safe copy of a Household."""
+    uuid: str
+    name: str
+    email: str
+
+
+# email -> (expires at, user record, household record)
+_identity_cache: dict[str, tuple[float, UserRecord, HouseholdRecord]] = {}
 
 
 def get_user(email: str) -> Optional[model.AppUser]:
@@ -32,4 +51,41 @@ def get_household(user: model.AppUser) -> Optional[model.Household]:
         return None
     stmt = select(model.Household).join(model.UserHousehold).where(model.UserHousehold.user_id == user.uuid)
     resp = model.db.session.execute(stmt).first()
-    return resp[0] if resp else None
\ No newline at end of file
+    return resp[0] if resp else None
+
+
+def get_identity(email: str) -> tuple[Optional[UserRecord], Optional[HouseholdRecord]]:
+    """Get the user and household records for an email address.
+
+    Successful lookups are cached in-process for IDENTITY_CACHE_TTL seconds,
+    so repeat requests from the same user skip both queries.
+
+    Args:
+        email: User's email address
+
+    Returns:
+        Tuple of (UserRecord or None, HouseholdRecord or None)
+    """
+    cached = _identity_cache.get(email)
+    if cached and cached[0] > time.monotonic():
+        return cached[1], cached[2]
+
+    user = get_user(email)
+    household = get_household(user)
+    user_record = UserRecord(user.uuid, user.name, user.email) if user else None
+    household_record = HouseholdRecord(household.uuid, household.name, household.email) if household else None
+    if user_record and household_record:
+        _identity_cache[email] = (time.monotonic() + model.IDENTITY_CACHE_TTL, user_record, household_record)
+    return user_record, household_record
+
+
+def invalidate_identity(email: Optional[str] = None) -> None:
+    """Drop cached identity records.
+
+    Args:
+        email: Email address to invalidate, or None to clear the whole cache
+    """
+    if email is None:
+        _identity_cache.clear()
+    else:
+        _identity_cache.pop(email, None)
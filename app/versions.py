@@ -0,0 +1,145 @@
+import functools
+import hashlib
+import model
+import os
+
+from datetime import datetime, timedelta, timezone
+from flask import g, make_response, request, session
+from sqlalchemy import func, select, update
+from typing import Callable, Optional
+
+# Workers forked from a preloaded app share the master's start time
+_STARTED = datetime.now(tz=timezone.utc)
+
+
+def bump(household_uuid: str) -> None:
+    """Record that a household's data changed.
+
+    Runs in the caller's transaction, so the new version becomes visible
+    exactly when the change itself commits.
+
+    Args:
+        household_uuid: UUID of the household
+    """
+    model.db.session.execute(
+        update(model.Household)
+        .where(model.Household.uuid == household_uuid)
+        .values(change_version=model.Household.change_version + 1, changed_at=func.now())
+    )
+    # Reads later in this request must not use the version from before the change
+    g.pop('household_tokens', None)
+
+
+def current(household_uuid: str) -> tuple[int, datetime]:
+    """Get a household's change version and when it last changed.
+
+    Args:
+        household_uuid: UUID of the household
+
+    Returns:
+        Tuple of (change version, changed at)
+    """
+    return model.db.session.execute(
+        select(model.Household.change_version, model.Household.changed_at)
+        .where(model.Household.uuid == household_uuid)
+    ).one()
+
+
+def _token(version: int, changed_at: datetime) -> str:
+    return f'{version}.{changed_at.timestamp():.6f}'
+
+
+def token(household_uuid: str) -> str:
+    """Get a string identifying the current state of a household's data.
+
+    Used in cache keys (see cache.household_cached). It pairs the change
+    version with the time of the change, so a version number reused after a
+    rolled back bump does not match entries cached from the uncommitted
+    data. Read from the database at most once per request.
+
+    Args:
+        household_uuid: UUID of the household
+    """
+    tokens = g.setdefault('household_tokens', {})
+    if household_uuid not in tokens:
+        tokens[household_uuid] = _token(*current(household_uuid))
+    return tokens[household_uuid]
+
+
+@functools.cache
+def release() -> str:
+    """Get the identifier of the deployed code.
+
+    RELEASE when it is set, otherwise a digest of the app's Python modules
+    and templates, so every worker of a deploy agrees on it and it changes
+    whenever the code that renders a response does.
+    """
+    if model.app.config['RELEASE']:
+        return model.app.config['RELEASE']
+    digest = hashlib.sha1()
+    for directory in (model.app.root_path, os.path.join(model.app.root_path, model.app.template_folder)):
+        for name in sorted(os.listdir(directory)):
+            if name.endswith(('.py', '.html')):
+                with open(os.path.join(directory, name), 'rb') as f:
+                    digest.update(name.encode())
+                    digest.update(f.read())
+    return digest.hexdigest()[:12]
+
+
+def conditional(bucket: Optional[timedelta] = None) -> Callable:
+    """Serve 304 Not Modified for GET routes whose household has not changed.
+
+    The ETag combines the deployed release (see release), the household's
+    change version, the full request path and the current time bucket, since
+    pages also render relative dates ("Today", "5 minutes ago"). Buckets
+    default to the APP_TIMEZONE day. Last-Modified is the latest of the last
+    change, the bucket start and the process start, so a deploy also
+    invalidates copies revalidated by date alone.
+    The view only runs when the client's copy is stale.
+
+    Args:
+        bucket: Length of time a rendered page stays valid without changes
+    """
+    def decorator(view: Callable) -> Callable:
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            household = session.get('household')
+            if request.method != 'GET' or not household:
+                return view(*args, **kwargs)
+
+            version, changed_at = current(household.uuid)
+            # Lets templates key cached fragments on the version (see fragments.py)
+            # and cached reads skip looking it up again
+            g.household_version = version
+            g.setdefault('household_tokens', {})[household.uuid] = _token(version, changed_at)
+            now = datetime.now(tz=model.APP_TIMEZONE)
+            if bucket:
+                bucket_start = datetime.fromtimestamp(now.timestamp() // bucket.total_seconds() * bucket.total_seconds(),
+                                                      tz=timezone.utc)
+            else:
+                bucket_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+            last_modified = max(changed_at, bucket_start, _STARTED).replace(microsecond=0)
+            etag = hashlib.sha1(
+                f'{release()}:{household.uuid}:{version}:{request.full_path}:{bucket_start.timestamp()}'.encode()
+            ).hexdigest()
+
+            if request.if_none_match:
+                not_modified = request.if_none_match.contains_weak(etag)
+            else:
+                not_modified = bool(request.if_modified_since and last_modified <= request.if_modified_since)
+
+            if not_modified:
+                response = make_response('', 304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            response.set_etag(etag, weak=True)
+            response.last_modified = last_modified
+            response.cache_control.private = True
+            response.cache_control.no_cache = True
+            return response
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,92 @@
+"""Microbenchmark for the days_view aggregation paths.
+
+Times two ways of building the days_view structure for one household's
+whole history:
+    orm     - hydrate Event/Pet/FoodEvent objects per raw event and
+              accumulate tuple keys in Python, then re-key with '|||'
+    rollup  - rollups.totals over the daily_pet_rollup table, re-keyed by
+              events.days_rows (what days_view uses)
+
+Usage (from the repository root, with DATABASE_URL set, after bench/generate.py):
+    python3 bench/days_view.py --email bench-user-0@example.com --repeat 5
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+from datetime import date
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app'))
+
+import events   # noqa: E402
+import model    # noqa: E402
+import rollups  # noqa: E402
+import users    # noqa: E402
+
+from sqlalchemy import func, select  # noqa: E402
+
+FIRST_DAY = date(1970, 1, 1)
+
+
+def _orm(household_uuid: str, last_day: date) -> tuple[int, list]:
+    rows = model.db.session.execute(
+        select(model.Event, model.Pet, model.FoodEvent)
+        .join(model.Pet, isouter=True)
+        .join(model.FoodEvent, isouter=True)
+        .where(model.Event.household_uuid == household_uuid)
+    ).all()
+    day_totals: dict = {}
+    for event, pet, food_event in rows:
+        day = event.timestamp.astimezone(model.APP_TIMEZONE).date()
+        event_data = day_totals.setdefault(day, {'Food': {}, 'Litter': {}, 'Medicine': {}, 'Vitals': {}})
+        key = (pet.name if pet and pet.name else '', pet.photo_addr if pet and pet.photo_addr else '')
+        match event.type:
+            case model.EventType.Food:
+                event_data['Food'][key] = event_data['Food'].get(key, 0.0) + (food_event.calories if food_event else 0)
+            case _:
+                event_data[event.type.name][key] = event_data[event.type.name].get(key, 0) + 1
+    days = [
+        {'date_iso': day.isoformat(),
+         'events': {event_type: {f'{name}|||{icon}': value for (name, icon), value in data.items()}
+                    for event_type, data in day_totals[day].items()}}
+        for day in sorted(day_totals, reverse=True)
+    ]
+    return len(rows), days
+
+
+def _rollup(household_uuid: str, last_day: date) -> tuple[int, list]:
+    totals = rollups.totals(household_uuid, FIRST_DAY, last_day)
+    return sum(len(pets) for day in totals.values() for pets in day.values()), events.days_rows(totals, len(totals))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark the days_view aggregation paths.')
+    parser.add_argument('--email', default='bench-user-0@example.com', help='user whose household is read')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with model.app.app_context():
+        _, household = users.get_identity(args.email)
+        if not household:
+            raise SystemExit(f'No household for {args.email}')
+        event_count = model.db.session.execute(
+            select(func.count()).select_from(model.Event).where(model.Event.household_uuid == household.uuid)
+        ).scalar()
+        last_day = date.today()
+        print(f'{event_count} events')
+
+        for name, path in (('orm', _orm), ('rollup', _rollup)):
+            timings = []
+            for _ in range(args.repeat):
+                model.db.session.expunge_all()
+                start = time.perf_counter()
+                rows, days = path(household.uuid, last_day)
+                timings.append((time.perf_counter() - start) * 1000)
+            print(f'{name:>7}: {len(days)} days from {rows} rows, '
+                  f'median {statistics.median(timings):.1f} ms, min {min(timings):.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
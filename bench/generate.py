@@ -0,0 +1,199 @@
+"""Synthetic data generator for benchmarking.
+
+Creates households with users, pets, saved foods/medicines and saved events,
+then years of Food, Litter, Medicine and Vitals history. Reference rows go
+through executemany; the event tables are bulk-loaded with COPY.
+
+Usage (from the repository root, with DATABASE_URL set):
+    python3 bench/generate.py --households 50 --years 3
+    python3 bench/generate.py --households 500 --pets 3 --years 5 --seed 7
+
+Users are created as bench-user-<n>@example.com, which bench/load.py logs in as.
+"""
+import argparse
+import csv
+import io
+import os
+import random
+import sys
+import time
+import uuid
+
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app'))
+
+import model    # noqa: E402
+import rollups  # noqa: E402
+
+from sqlalchemy import func, insert, select, text  # noqa: E402
+
+PET_NAMES = ['Appa', 'Tupo', 'Momo', 'Miso', 'Nori', 'Biscuit', 'Pepper', 'Luna', 'Olive', 'Mochi']
+FOODS = [
+    ('Salmon Pate', model.FoodType.WET, 1.0, model.Unit.CANS, 170),
+    ('Chicken Kibble', model.FoodType.DRY, 0.25, model.Unit.CUPS, 110),
+    ('Tuna Flakes', model.FoodType.WET, 3.0, model.Unit.OZ, 80),
+    ('Freeze-Dried Chicken', model.FoodType.TREATS, 5.0, model.Unit.GRAMS, 20),
+]
+MEDICINES = [('Gabapentin', '50mg'), ('Flea Drops', '1 tube'), ('Prednisolone', '5mg')]
+
+
+def _households(count: int, pets_per_household: int, rng: random.Random) -> list[dict]:
+    """Build in-memory descriptions of each household and its reference rows."""
+    households = []
+    for n in range(count):
+        household_uuid = str(uuid.uuid4())
+        households.append({
+            'uuid': household_uuid,
+            'name': f'Bench Household {n}',
+            'email': f'bench-household-{n}@example.com',
+            'user_uuid': str(uuid.uuid4()),
+            'user_email': f'bench-user-{n}@example.com',
+            'pets': [
+                {
+                    'uuid': str(uuid.uuid4()),
+                    'name': rng.choice(PET_NAMES),
+                    'weight': rng.uniform(3.0, 7.0),
+                }
+                for _ in range(pets_per_household)
+            ],
+        })
+    return households
+
+
+def _load_reference_rows(households: list[dict]) -> None:
+    """Insert households, users, pets, saved foods, medicines and saved events."""
+    session = model.db.session
+    session.execute(insert(model.Household), [
+        {'uuid': h['uuid'], 'name': h['name'], 'email': h['email']} for h in households
+    ])
+    session.execute(insert(model.AppUser), [
+        {'uuid': h['user_uuid'], 'name': h['name'], 'email': h['user_email']} for h in households
+    ])
+    session.execute(insert(model.UserHousehold), [
+        {'user_id': h['user_uuid'], 'household_id': h['uuid']} for h in households
+    ])
+    session.execute(insert(model.Pet), [
+        {'uuid': p['uuid'], 'household_uuid': h['uuid'], 'species': model.Species.CAT,
+         'name': p['name'], 'birthdate': None, 'photo_addr': None}
+        for h in households for p in h['pets']
+    ])
+    session.execute(insert(model.FoodMeta), [
+        {'uuid': str(uuid.uuid4()), 'household_uuid': h['uuid'], 'name': name, 'type': food_type,
+         'serving_size': serving_size, 'unit': unit, 'calories': calories, 'archived': False}
+        for h in households for name, food_type, serving_size, unit, calories in FOODS
+    ])
+    session.execute(insert(model.MedicineMeta), [
+        {'uuid': str(uuid.uuid4()), 'household_uuid': h['uuid'], 'name': name, 'archived': False}
+        for h in households for name, _ in MEDICINES
+    ])
+    session.execute(insert(model.SavedEvent), [
+        {'uuid': str(uuid.uuid4()), 'household_uuid': h['uuid'], 'pet_uuid': p['uuid'],
+         'type': model.EventType.Food, 'name': f"{p['name']} breakfast",
+         'meta': {'name': FOODS[0][0], 'type': FOODS[0][1].value, 'amount': 1,
+                  'unit': FOODS[0][3].value, 'calories': FOODS[0][4]}}
+        for h in households for p in h['pets']
+    ])
+    session.commit()
+
+
+def _copy(cursor, table: str, columns: list[str], rows: io.StringIO) -> None:
+    rows.seek(0)
+    cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", rows)
+
+
+def _load_events(households: list[dict], years: float, batch_days: int, rng: random.Random) -> int:
+    """Generate and COPY event history, one batch of days at a time.
+
+    Event IDs are assigned client-side after the current maximum so metadata
+    rows can reference them without a round-trip per event; the sequence is
+    advanced past them at the end.
+
+    Returns:
+        Number of events created
+    """
+    now = datetime.now(tz=model.APP_TIMEZONE).replace(second=0, microsecond=0)
+    total_days = int(years * 365)
+    first_id = next_id = model.db.session.execute(select(func.coalesce(func.max(model.Event.id), 0))).scalar_one() + 1
+
+    raw = model.db.engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        for batch_start in range(0, total_days, batch_days):
+            events_csv, food_csv, medicine_csv, vitals_csv = (io.StringIO() for _ in range(4))
+            events_out, food_out, medicine_out, vitals_out = (csv.writer(f) for f in
+                                                              (events_csv, food_csv, medicine_csv, vitals_csv))
+
+            for day_offset in range(batch_start, min(batch_start + batch_days, total_days)):
+                day = (now - timedelta(days=day_offset)).replace(hour=0, minute=0)
+                for h in households:
+                    def event(event_type, pet_uuid, hour):
+                        nonlocal next_id
+                        event_id = next_id
+                        next_id += 1
+                        timestamp = day + timedelta(hours=hour, minutes=rng.randrange(60))
+                        events_out.writerow([event_id, h['uuid'], pet_uuid or '', timestamp.isoformat(),
+                                             event_type.name, timestamp.isoformat(), h['user_uuid']])
+                        return event_id
+
+                    for pet in h['pets']:
+                        for hour in (7, 12, 18)[:rng.randint(2, 3)]:
+                            name, food_type, serving_size, unit, calories = rng.choice(FOODS)
+                            food_out.writerow([str(uuid.uuid4()), event(model.EventType.Food, pet['uuid'], hour),
+                                               name, food_type.name, serving_size, unit.name, calories])
+                        if rng.random() < 0.1:
+                            name, dose = rng.choice(MEDICINES)
+                            medicine_out.writerow([str(uuid.uuid4()),
+                                                   event(model.EventType.Medicine, pet['uuid'], 9), name, dose])
+                        if day_offset % 7 == 0:
+                            pet['weight'] += rng.uniform(-0.05, 0.05)
+                            vitals_out.writerow([str(uuid.uuid4()), event(model.EventType.Vitals, pet['uuid'], 8),
+                                                 model.VitalsType.Weight.name, round(pet['weight'], 2)])
+                    for _ in range(rng.randint(1, 2)):
+                        event(model.EventType.Litter, None, rng.randrange(24))
+
+            # Empty CSV fields load as NULL for the nullable pet_uuid column
+            _copy(cursor, 'event', ['id', 'household_uuid', 'pet_uuid', 'timestamp', 'type', 'created_at',
+                                    'created_by'], events_csv)
+            _copy(cursor, 'food_event', ['uuid', 'event_id', 'name', 'type', 'serving_size', 'unit',
+                                         'calories'], food_csv)
+            _copy(cursor, 'medicine_event', ['uuid', 'event_id', 'name', 'dose'], medicine_csv)
+            _copy(cursor, 'vitals_event', ['uuid', 'event_id', 'type', 'value'], vitals_csv)
+            raw.commit()
+            print(f'  loaded days {batch_start}-{min(batch_start + batch_days, total_days) - 1}')
+
+        cursor.execute("SELECT setval(pg_get_serial_sequence('event', 'id'), %s)", (next_id - 1,))
+        raw.commit()
+    finally:
+        raw.close()
+
+    return next_id - first_id
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--households', type=int, default=10, help='number of households to create')
+    parser.add_argument('--pets', type=int, default=2, help='pets per household')
+    parser.add_argument('--years', type=float, default=2.0, help='years of history per household')
+    parser.add_argument('--batch-days', type=int, default=30, help='days of history per COPY batch')
+    parser.add_argument('--seed', type=int, default=None, help='random seed for reproducible datasets')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with model.app.app_context():
+        start = time.perf_counter()
+        households = _households(args.households, args.pets, rng)
+        _load_reference_rows(households)
+        print(f'Created {len(households)} households')
+
+        created = _load_events(households, args.years, args.batch_days, rng)
+
+        for h in households:
+            rollups.rebuild(h['uuid'])
+        model.db.session.execute(text('ANALYZE'))
+        model.db.session.commit()
+        print(f'Created {created} events in {time.perf_counter() - start:.1f}s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""HTTP load driver for the main read routes.
+
+Each worker thread logs in as one of the generated bench users and requests
+the routes round-robin, recording per-route latency. Throughput and latency
+percentiles are printed at the end; a non-zero exit status means requests
+failed.
+
+Usage (against a running server, after bench/generate.py):
+    python3 bench/load.py --base-url http://localhost:8000 --households 50 --concurrency 16 --requests 2000
+"""
+import argparse
+import http.cookiejar
+import sys
+import threading
+import time
+import urllib.parse
+import urllib.request
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+ROUTES = ['/', '/events/all', '/events/day', '/api/events/days']
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def _login(base_url: str, email: str) -> urllib.request.OpenerDirector:
+    """Open a cookie-carrying client session logged in as email."""
+    opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar()))
+    opener.open(base_url + '/', data=urllib.parse.urlencode({'email': email}).encode()).read()
+    return opener
+
+
+def _path(route: str, n: int) -> str:
+    # Walk the infinite-scroll API back through history like a scrolling client
+    if route == '/api/events/days':
+        start = date.today() - timedelta(days=5 * (n % 50))
+        return f'{route}?start_date={start.isoformat()}&limit=5'
+    return route
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--base-url', default='http://localhost:8000')
+    parser.add_argument('--households', type=int, default=10, help='number of generated bench users to log in as')
+    parser.add_argument('--concurrency', type=int, default=8, help='number of concurrent clients')
+    parser.add_argument('--requests', type=int, default=1000, help='total requests across all clients')
+    parser.add_argument('--routes', default=','.join(ROUTES), help='comma-separated routes to exercise')
+    args = parser.parse_args()
+
+    routes = args.routes.split(',')
+    latencies: dict[str, list[float]] = {route: [] for route in routes}
+    errors: dict[str, int] = {route: 0 for route in routes}
+    lock = threading.Lock()
+    counter = iter(range(args.requests))
+
+    def client(worker: int) -> None:
+        opener = _login(args.base_url, f'bench-user-{worker % args.households}@example.com')
+        for n in counter:
+            route = routes[n % len(routes)]
+            start = time.perf_counter()
+            try:
+                with opener.open(args.base_url + _path(route, n)) as response:
+                    response.read()
+                ok = True
+            except Exception:
+                ok = False
+            elapsed = time.perf_counter() - start
+            with lock:
+                latencies[route].append(elapsed)
+                if not ok:
+                    errors[route] += 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        list(pool.map(client, range(args.concurrency)))
+    wall = time.perf_counter() - start
+
+    total = sum(len(samples) for samples in latencies.values())
+    print(f'{total} requests in {wall:.2f}s ({total / wall:.1f} req/s), concurrency {args.concurrency}')
+    print(f"{'route':<20}{'count':>8}{'errors':>8}{'req/s':>9}{'p50 ms':>9}{'p90 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+    for route, samples in latencies.items():
+        print(f'{route:<20}{len(samples):>8}{errors[route]:>8}{len(samples) / wall:>9.1f}'
+              + ''.join(f'{_percentile(samples, pct) * 1000:>9.1f}' for pct in (50, 90, 95, 99)))
+
+    sys.exit(1 if any(errors.values()) else 0)
+
+
+if __name__ == '__main__':
+    main()
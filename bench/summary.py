@@ -0,0 +1,98 @@
+"""Scaling benchmark for the home page summary query.
+
+Times two ways of finding the latest event of each type for each pet, for
+growing slices of one household's history, each the newest N events:
+    distinct_on - DISTINCT ON (type, pet) over the household's events since
+                  the start of the slice (the summary before latest_event)
+    latest      - events.summary_query, which joins the latest_event
+                  pointers (what summary uses); it reads the same rows
+                  whatever the history length, so it is timed once per slice
+                  only to show that it stays flat
+
+Usage (from the repository root, with DATABASE_URL set, after bench/generate.py):
+    python3 bench/summary.py --email bench-user-0@example.com --events 1000 100000 --repeat 5
+
+A 10M-event household takes about 100 pets and 100 years of history:
+    python3 bench/generate.py --households 1 --pets 100 --years 100
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app'))
+
+import events   # noqa: E402
+import model    # noqa: E402
+import users    # noqa: E402
+
+from sqlalchemy import func, select  # noqa: E402
+
+
+def _distinct_on(household_uuid: str, since: datetime):
+    return (select(*events._EVENT_COLUMNS)
+            .distinct(model.Event.type, model.Event.pet_uuid)
+            .join(model.Pet, isouter=True)
+            .join(model.FoodEvent, isouter=True)
+            .join(model.MedicineEvent, isouter=True)
+            .join(model.VitalsEvent, isouter=True)
+            .where(model.Event.household_uuid == household_uuid)
+            .where(model.Event.timestamp >= since)
+            .order_by(model.Event.type, model.Event.pet_uuid, model.Event.timestamp.desc()))
+
+
+def _time(query, repeat: int) -> tuple[int, float]:
+    """Run a query repeat times; returns (rows, median milliseconds)."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows = model.db.session.execute(query).all()
+        timings.append((time.perf_counter() - start) * 1000)
+    return len(rows), statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark the summary query against history length.')
+    parser.add_argument('--email', default='bench-user-0@example.com', help='user whose household is read')
+    parser.add_argument('--events', type=int, nargs='+', default=[1000, 10000, 100000, 1000000, 10000000],
+                        help='history slices, as the number of newest events; larger than the history means all of it')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with model.app.app_context():
+        _, household = users.get_identity(args.email)
+        if not household:
+            raise SystemExit(f'No household for {args.email}')
+        slices = []
+        for count in sorted(set(args.events)):
+            # Timestamp of the count-th newest event; None once the history is shorter
+            since = model.db.session.execute(
+                select(model.Event.timestamp)
+                .where(model.Event.household_uuid == household.uuid)
+                .order_by(model.Event.timestamp.desc())
+                .offset(count - 1).limit(1)
+            ).scalar()
+            slices.append((f'{count:,}' if since else 'all', since or datetime(1970, 1, 1, tzinfo=model.APP_TIMEZONE)))
+            if since is None:
+                break
+
+        print(f"{'slice':>10} {'events':>9} {'distinct_on ms':>15} {'latest ms':>10} {'rows':>5}")
+        for label, since in slices:
+            event_count = model.db.session.execute(
+                select(func.count()).select_from(model.Event)
+                .where(model.Event.household_uuid == household.uuid)
+                .where(model.Event.timestamp >= since)
+            ).scalar()
+            # Warm both plans and the buffer cache before timing
+            _time(_distinct_on(household.uuid, since), 1)
+            _time(events.summary_query(household.uuid), 1)
+            _, distinct_ms = _time(_distinct_on(household.uuid, since), args.repeat)
+            rows, latest_ms = _time(events.summary_query(household.uuid), args.repeat)
+            print(f'{label:>10} {event_count:>9} {distinct_ms:>15.2f} {latest_ms:>10.2f} {rows:>5}')
+
+
+if __name__ == '__main__':
+    main()
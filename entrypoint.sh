@@ -5,4 +5,4 @@ python3 seed.py
 
 # Start server
 echo "Starting server"
-flask --app app/server run --host=0.0.0.0 -p 8000 --debug
\ No newline at end of file
+exec gunicorn -c gunicorn.conf.py
\ No newline at end of file
@@ -0,0 +1,72 @@
+"""Gunicorn configuration for production serving.
+
+Run with: gunicorn -c gunicorn.conf.py
+Send SIGHUP to the master to gracefully restart the workers. With
+preload_app on (the default) they fork from the master's already imported
+app, so SIGHUP does not pick up new code: deploy code by restarting the
+master, or by USR2 followed by QUIT to the old master.
+"""
+import multiprocessing
+import os
+
+# Application modules import each other by bare name (import model), so the
+# app directory has to be on the path
+pythonpath = 'app'
+wsgi_app = 'server:app'
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+
+# Pre-fork workers, each with a small thread pool for I/O-bound requests
+workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+worker_class = 'gthread'
+
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', 5))           # Seconds
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 30))               # Seconds
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', 30))
+
+# Recycle workers periodically; jitter keeps them from restarting together
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 1000))
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', 100))
+
+# Import the app once in the master so workers fork with it already loaded
+preload_app = os.environ.get('GUNICORN_PRELOAD', 'True').lower() == 'true'
+
+accesslog = '-'
+errorlog = '-'
+
+# Sessions have to be visible to every worker, so default to the Postgres
+# store; set before the app is imported since model.py reads it then
+os.environ.setdefault('SESSION_TYPE', 'sqlalchemy')
+
+# Likewise metrics: each worker writes its samples to files in this
+# directory so /metrics can aggregate all of them. prometheus_client reads
+# it when the app is imported, and the directory has to exist by then.
+os.environ.setdefault('PROMETHEUS_MULTIPROC_DIR', '/tmp/pets-metrics')
+os.makedirs(os.environ['PROMETHEUS_MULTIPROC_DIR'], exist_ok=True)
+
+
+def on_starting(server):
+    """Refuse per-process sessions with several workers and clear metric files left by a previous run."""
+    if os.environ['SESSION_TYPE'] == 'memory' and server.cfg.workers > 1:
+        raise RuntimeError('SESSION_TYPE=memory keeps sessions inside one worker process; '
+                           'use SESSION_TYPE=sqlalchemy or run a single worker')
+
+    metrics_dir = os.environ['PROMETHEUS_MULTIPROC_DIR']
+    for name in os.listdir(metrics_dir):
+        os.remove(os.path.join(metrics_dir, name))
+
+
+def child_exit(server, worker):
+    """Drop a dead worker's live gauges from the aggregated metrics."""
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
+
+
+def post_fork(server, worker):
+    """Drop connections inherited from the master so each worker opens its own."""
+    import model
+
+    with model.app.app_context():
+        model.db.engine.dispose(close=False)
@@ -10,6 +10,8 @@ import sys
 
 # Add the parent directory to the path so we can import app modules
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+# app modules import each other by bare name (e.g. model imports pool_stats)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), 'app'))
 
 # Import Flask app and models
 from app import model
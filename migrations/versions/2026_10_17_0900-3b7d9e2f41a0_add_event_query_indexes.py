@@ -0,0 +1,51 @@
+"""add event query indexes
+
+Revision ID: 3b7d9e2f41a0
+Revises: 1620aefe6fee
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7d9e2f41a0'
+down_revision: Union[str, None] = '1620aefe6fee'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction, and without
+    # it building these on a large event table blocks writes until it ends
+    with op.get_context().autocommit_block():
+        # Household timeline: all_events, day_view and days_view filter on household
+        # and range/sort on timestamp (id breaks ties for keyset pagination)
+        op.create_index(op.f('ix_event_household_uuid_timestamp'), 'event',
+                        ['household_uuid', 'timestamp', 'id'], unique=False, postgresql_concurrently=True)
+        # Per-pet series of one event type (trends)
+        op.create_index(op.f('ix_event_household_uuid_type_pet_uuid_timestamp'), 'event',
+                        ['household_uuid', 'type', 'pet_uuid', 'timestamp'], unique=False,
+                        postgresql_concurrently=True)
+
+        # Join keys for the typed metadata tables; food carries calories so the
+        # day aggregation can be answered from the index alone
+        op.create_index(op.f('ix_food_event_event_id'), 'food_event', ['event_id'], unique=False,
+                        postgresql_include=['calories'], postgresql_concurrently=True)
+        op.create_index(op.f('ix_medicine_event_event_id'), 'medicine_event', ['event_id'], unique=False,
+                        postgresql_concurrently=True)
+        op.create_index(op.f('ix_vitals_event_event_id'), 'vitals_event', ['event_id'], unique=False,
+                        postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(op.f('ix_vitals_event_event_id'), table_name='vitals_event', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_medicine_event_event_id'), table_name='medicine_event', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_food_event_event_id'), table_name='food_event', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_event_household_uuid_type_pet_uuid_timestamp'), table_name='event',
+                      postgresql_concurrently=True)
+        op.drop_index(op.f('ix_event_household_uuid_timestamp'), table_name='event', postgresql_concurrently=True)
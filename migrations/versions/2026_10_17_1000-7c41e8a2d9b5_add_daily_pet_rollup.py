@@ -0,0 +1,58 @@
+"""add daily pet rollup
+
+Revision ID: 7c41e8a2d9b5
+Revises: 3b7d9e2f41a0
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+import os
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c41e8a2d9b5'
+down_revision: Union[str, None] = '3b7d9e2f41a0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('daily_pet_rollup',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('household_uuid', sa.String(length=64), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('pet_uuid', sa.String(length=64), nullable=True),
+    sa.Column('type', postgresql.ENUM(name='eventtype', create_type=False), nullable=False),
+    sa.Column('calories', sa.Integer(), nullable=False),
+    sa.Column('event_count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['household_uuid'], ['household.uuid'], ),
+    sa.ForeignKeyConstraint(['pet_uuid'], ['pet.uuid'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    # Litter events have no pet, so NULL pet_uuid must still be unique per day
+    op.create_index(op.f('ix_daily_pet_rollup_household_uuid_day_pet_uuid_type'), 'daily_pet_rollup',
+                    ['household_uuid', 'day', 'pet_uuid', 'type'], unique=True,
+                    postgresql_nulls_not_distinct=True)
+
+    # Backfill from existing history (same bucketing as app/rollups.py)
+    op.execute(sa.text("""
+        INSERT INTO daily_pet_rollup (household_uuid, day, pet_uuid, type, calories, event_count)
+        SELECT event.household_uuid,
+               date(timezone(:tz, event.timestamp)) AS day,
+               event.pet_uuid,
+               event.type,
+               coalesce(sum(food_event.calories), 0),
+               count(event.id)
+        FROM event
+        LEFT OUTER JOIN food_event ON event.id = food_event.event_id
+        GROUP BY event.household_uuid, day, event.pet_uuid, event.type
+    """).bindparams(tz=os.environ.get('APP_TIMEZONE', 'America/Los_Angeles')))
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_daily_pet_rollup_household_uuid_day_pet_uuid_type'), table_name='daily_pet_rollup')
+    op.drop_table('daily_pet_rollup')
@@ -0,0 +1,51 @@
+"""add latest event
+
+Revision ID: e5a90c3f7b12
+Revises: 7c41e8a2d9b5
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a90c3f7b12'
+down_revision: Union[str, None] = '7c41e8a2d9b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('latest_event',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('household_uuid', sa.String(length=64), nullable=False),
+    sa.Column('type', postgresql.ENUM(name='eventtype', create_type=False), nullable=False),
+    sa.Column('pet_uuid', sa.String(length=64), nullable=True),
+    sa.Column('event_id', sa.Integer(), nullable=False),
+    sa.Column('timestamp', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['event_id'], ['event.id'], ),
+    sa.ForeignKeyConstraint(['household_uuid'], ['household.uuid'], ),
+    sa.ForeignKeyConstraint(['pet_uuid'], ['pet.uuid'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_latest_event_household_uuid_type_pet_uuid'), 'latest_event',
+                    ['household_uuid', 'type', 'pet_uuid'], unique=True,
+                    postgresql_nulls_not_distinct=True)
+
+    # Backfill one pointer per (household, type, pet) from existing history
+    op.execute("""
+        INSERT INTO latest_event (household_uuid, type, pet_uuid, event_id, timestamp)
+        SELECT DISTINCT ON (household_uuid, type, pet_uuid)
+               household_uuid, type, pet_uuid, id, timestamp
+        FROM event
+        ORDER BY household_uuid, type, pet_uuid, timestamp DESC, id DESC
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_latest_event_household_uuid_type_pet_uuid'), table_name='latest_event')
+    op.drop_table('latest_event')
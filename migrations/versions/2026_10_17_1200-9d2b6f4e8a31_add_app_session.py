@@ -0,0 +1,33 @@
+"""add app session
+
+Revision ID: 9d2b6f4e8a31
+Revises: e5a90c3f7b12
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d2b6f4e8a31'
+down_revision: Union[str, None] = 'e5a90c3f7b12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('app_session',
+    sa.Column('sid', sa.String(length=64), nullable=False),
+    sa.Column('data', sa.LargeBinary(), nullable=False),
+    sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('sid')
+    )
+    op.create_index(op.f('ix_app_session_expires_at'), 'app_session', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_app_session_expires_at'), table_name='app_session')
+    op.drop_table('app_session')
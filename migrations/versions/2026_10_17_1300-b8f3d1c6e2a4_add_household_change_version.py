@@ -0,0 +1,32 @@
+"""add household change version
+
+Revision ID: b8f3d1c6e2a4
+Revises: 9d2b6f4e8a31
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8f3d1c6e2a4'
+down_revision: Union[str, None] = '9d2b6f4e8a31'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('household',
+        sa.Column('change_version', sa.BigInteger(), nullable=False, server_default='0')
+    )
+    op.add_column('household',
+        sa.Column('changed_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now())
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('household', 'changed_at')
+    op.drop_column('household', 'change_version')
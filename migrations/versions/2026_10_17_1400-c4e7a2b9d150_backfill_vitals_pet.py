@@ -0,0 +1,48 @@
+"""backfill vitals pet
+
+Revision ID: c4e7a2b9d150
+Revises: b8f3d1c6e2a4
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e7a2b9d150'
+down_revision: Union[str, None] = 'b8f3d1c6e2a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Households with exactly one pet; their pet-less Vitals events can only be that pet's
+ONLY_PET = """
+    SELECT household_uuid, min(uuid) AS pet_uuid
+    FROM pet
+    WHERE household_uuid IS NOT NULL
+    GROUP BY household_uuid
+    HAVING count(*) = 1
+"""
+
+
+def upgrade() -> None:
+    # Vitals events used to be stored without their pet. Where the household
+    # has a single pet, attribute them (and their rollup rows and latest
+    # pointers) to it; with several pets there is no record of which pet was
+    # weighed, so those events stay household-level.
+    for table in ('event', 'daily_pet_rollup', 'latest_event'):
+        op.execute(f"""
+            UPDATE {table}
+            SET pet_uuid = only_pet.pet_uuid
+            FROM ({ONLY_PET}) AS only_pet
+            WHERE {table}.household_uuid = only_pet.household_uuid
+              AND {table}.type = 'Vitals'
+              AND {table}.pet_uuid IS NULL
+        """)
+
+
+def downgrade() -> None:
+    # Backfilled pets cannot be told apart from ones recorded with the event
+    pass
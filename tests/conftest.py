@@ -0,0 +1,84 @@
+"""Shared fixtures for the tests.
+
+The tests run against a real Postgres database named by TEST_DATABASE_URL.
+Its tables are dropped and recreated, so never point it at data you want
+to keep. Without TEST_DATABASE_URL every test is skipped.
+
+Usage (from the repository root):
+    TEST_DATABASE_URL=postgresql://localhost/pets_test python3 -m pytest tests
+"""
+import os
+import sys
+import uuid
+
+import pytest
+
+TEST_DATABASE_URL = os.environ.get('TEST_DATABASE_URL')
+# model reads DATABASE_URL on import; the placeholder is never connected to
+os.environ['DATABASE_URL'] = TEST_DATABASE_URL or 'postgresql://localhost/unset'
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app'))
+
+import events  # noqa: E402
+import model   # noqa: E402
+import server  # noqa: E402
+
+
+@pytest.fixture(scope='session')
+def app():
+    """The Flask app on a freshly created schema, with query budgets enforced."""
+    if not TEST_DATABASE_URL:
+        pytest.skip('TEST_DATABASE_URL is not set')
+    server.app.config.update(TESTING=True, QUERY_BUDGET_ENFORCE=True)
+    with server.app.app_context():
+        model.db.drop_all()
+        model.db.create_all()
+    yield server.app
+    with server.app.app_context():
+        model.db.session.remove()
+        model.db.drop_all()
+
+
+@pytest.fixture
+def household(app) -> dict:
+    """A new household with one user and two cats.
+
+    Returns:
+        Dictionary with the household 'uuid', the user's 'user_uuid' and
+        'email', and the 'pets' UUIDs
+    """
+    household_uuid, user_uuid = str(uuid.uuid4()), str(uuid.uuid4())
+    pet_uuids = [str(uuid.uuid4()), str(uuid.uuid4())]
+    with app.app_context():
+        model.db.session.add(model.Household(uuid=household_uuid, name='Test Household',
+                                             email=f'household-{household_uuid}@example.com'))
+        model.db.session.add(model.AppUser(uuid=user_uuid, name='Test User', email=f'user-{user_uuid}@example.com'))
+        model.db.session.flush()
+        model.db.session.add(model.UserHousehold(user_id=user_uuid, household_id=household_uuid))
+        for pet_uuid, name in zip(pet_uuids, ('Appa', 'Momo')):
+            model.db.session.add(model.Pet(uuid=pet_uuid, household_uuid=household_uuid, species=model.Species.CAT,
+                                           name=name))
+        model.db.session.commit()
+    return {'uuid': household_uuid, 'user_uuid': user_uuid, 'email': f'user-{user_uuid}@example.com',
+            'pets': pet_uuids}
+
+
+@pytest.fixture
+def client(app, household):
+    """A test client logged in as the household's user."""
+    client = app.test_client()
+    client.post('/', data={'email': household['email']})
+    return client
+
+
+@pytest.fixture
+def add_event(app, household):
+    """Create events in the household through events.new.
+
+    Returns:
+        Function taking the event type, timestamp and new event form fields
+    """
+    def add(event_type: model.EventType, timestamp, data: dict) -> None:
+        with app.app_context():
+            events.new(household['uuid'], event_type, household['user_uuid'], data, timestamp)
+
+    return add
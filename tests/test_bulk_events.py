@@ -0,0 +1,17 @@
+"""Tests for the bulk event API."""
+import pytest
+
+
+@pytest.mark.parametrize('value', ['nan', 'inf', '-inf', 'NaN', 'Infinity'])
+def test_non_finite_numbers_are_rejected(client, household, value):
+    pet = household['pets'][0]
+    response = client.post('/api/events/bulk', json={'events': [
+        {'type': 'Food', 'pet': pet, 'food-name': 'Salmon Pate', 'food-amount': value},
+        {'type': 'Vitals', 'pet': pet, 'vitals-weight': value},
+        {'type': 'Vitals', 'pet': pet, 'vitals-weight': '4.5'},
+    ]})
+
+    assert response.status_code == 201
+    body = response.get_json()
+    assert body['created'] == 1
+    assert [error['index'] for error in body['errors']] == [0, 1]
@@ -0,0 +1,12 @@
+"""Tests for response compression."""
+
+
+def test_not_modified_response_varies_on_accept_encoding(client):
+    response = client.get('/api/events/summary', headers={'Accept-Encoding': 'gzip'})
+    assert response.status_code == 200
+    assert 'Accept-Encoding' in response.vary
+
+    response = client.get('/api/events/summary', headers={'Accept-Encoding': 'gzip',
+                                                          'If-None-Match': response.headers['ETag']})
+    assert response.status_code == 304
+    assert 'Accept-Encoding' in response.vary
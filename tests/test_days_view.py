@@ -0,0 +1,20 @@
+"""Tests for the day list built by rollups.days_json_query."""
+import model
+
+from datetime import datetime, timedelta
+
+
+def test_days_api_totals_keep_their_types(client, household, add_event):
+    yesterday = datetime.now(tz=model.APP_TIMEZONE) - timedelta(days=1)
+    pet = household['pets'][0]
+    for calories in ('170', '80'):
+        add_event(model.EventType.Food, yesterday, {'pet': pet, 'food-name': 'Salmon Pate', 'food-type': 'wet',
+                                                    'food-amount': '1', 'food-unit': 'cans', 'food-calories': calories})
+    add_event(model.EventType.Litter, yesterday, {})
+
+    days = client.get('/api/events/days?limit=5').get_json()['days']
+    assert [day['date'] for day in days] == ['Yesterday']
+    day_events = days[0]['events']
+    assert day_events == {'Food': {'Appa|||': 250.0}, 'Litter': {'|||': 1}, 'Medicine': {}, 'Vitals': {}}
+    assert isinstance(day_events['Food']['Appa|||'], float)
+    assert isinstance(day_events['Litter']['|||'], int)
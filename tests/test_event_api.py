@@ -0,0 +1,27 @@
+"""Tests for the JSON event list APIs."""
+import events
+import model
+import pytest
+import saved_events
+
+from dataclasses import fields
+from datetime import datetime
+
+
+def test_event_apis_keep_their_json_keys(client, household, add_event):
+    timestamp = model.APP_TIMEZONE.localize(datetime(2026, 3, 2, 8))
+    add_event(model.EventType.Medicine, timestamp,
+              {'pet': household['pets'][0], 'medicine-name': 'Gabapentin', 'medicine-dose': '50mg'})
+
+    events = client.get('/api/events/all').get_json()['events']
+    assert list(events[0]) == ['id', 'timestamp', 'type', 'pet-name', 'pet-icon', 'meta']
+    assert events[0]['pet-name'] == 'Appa'
+    assert events[0]['meta'] == {'name': 'Gabapentin', 'dose': '50mg'}
+
+    summary = client.get('/api/events/summary').get_json()['events']
+    assert list(summary[0]) == ['type', 'pet-name', 'pet-icon', 'time_ago', 'meta']
+
+
+@pytest.mark.parametrize('record', [events.EventRecord, events.SummaryRecord, saved_events.SavedEventRecord])
+def test_record_json_keys_cover_every_field(record):
+    assert list(record.json_keys) == [field.name for field in fields(record)]
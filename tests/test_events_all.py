@@ -0,0 +1,20 @@
+"""Tests for the /events/all history page."""
+from flask import before_render_template, template_rendered
+
+
+def test_streamed_page_sends_template_signals(app, client):
+    sent = []
+
+    def record(signal):
+        def receiver(sender, template, context, **extra):
+            sent.append((signal, template.name))
+        return receiver
+
+    before, rendered = record('before'), record('rendered')
+    with before_render_template.connected_to(before, app), template_rendered.connected_to(rendered, app):
+        response = client.get('/events/all?stream=1')
+        assert response.status_code == 200
+        response.get_data()
+
+    assert ('before', 'events_all.html') in sent
+    assert ('rendered', 'events_all.html') in sent
@@ -0,0 +1,21 @@
+"""Tests for the concurrent page reads."""
+from prometheus_client import REGISTRY
+
+
+def _in_flight() -> float:
+    return REGISTRY.get_sample_value('http_requests_in_flight')
+
+
+def _latency_count(endpoint: str) -> float:
+    return REGISTRY.get_sample_value('http_request_duration_seconds_count',
+                                     {'endpoint': endpoint, 'method': 'GET', 'status': '200'}) or 0
+
+
+def test_fanned_out_request_is_counted_once(client):
+    in_flight, count = _in_flight(), _latency_count('new_event')
+
+    for _ in range(5):
+        assert client.get('/events/new').status_code == 200
+
+    assert _in_flight() == in_flight
+    assert _latency_count('new_event') == count + 5
@@ -0,0 +1,34 @@
+"""Tests for the fragment cache."""
+import cache
+import fragments
+import model
+
+from datetime import datetime, timedelta
+
+
+class CountingBackend(cache.MemoryBackend):
+    def __init__(self):
+        super().__init__(100)
+        self.gets = 0
+
+    def get(self, key):
+        self.gets += 1
+        return super().get(key)
+
+
+def test_event_page_is_one_fragment_lookup(client, household, add_event, monkeypatch):
+    store = CountingBackend()
+    monkeypatch.setattr(fragments, '_store', store)
+    start = model.APP_TIMEZONE.localize(datetime(2026, 3, 2, 8))
+    for hour in range(5):
+        add_event(model.EventType.Litter, start + timedelta(hours=hour), {'pet': household['pets'][0]})
+
+    for _ in range(2):
+        response = client.get('/events/all')
+        assert response.status_code == 200
+        assert response.get_data(as_text=True).count('data-event-type="Litter"') == 5
+    assert store.gets == 2
+
+    response = client.get('/events/all?stream=1')
+    assert response.get_data(as_text=True).count('data-event-type="Litter"') == 5
+    assert store.gets == 2
@@ -0,0 +1,15 @@
+"""Tests for the Prometheus instrumentation."""
+import model
+import pytest
+
+from sqlalchemy import text
+from sqlalchemy.exc import ProgrammingError
+
+
+def test_failed_statement_leaves_no_start_time(app):
+    with app.app_context():
+        connection = model.db.session.connection()
+        with pytest.raises(ProgrammingError):
+            model.db.session.execute(text('SELECT * FROM no_such_table'))
+        assert connection.info['metrics_start'] == []
+        model.db.session.rollback()
@@ -0,0 +1,26 @@
+"""Tests for the connection pool statistics."""
+import pool_stats
+import pytest
+
+from conftest import TEST_DATABASE_URL
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+
+def test_checkouts_overflow_and_timeouts_are_counted(app):
+    engine = create_engine(TEST_DATABASE_URL, pool_size=1, max_overflow=1, pool_timeout=0.1)
+    pool_stats.instrument(engine)
+    stats = pool_stats.stats
+    checkouts, overflow_events, timeouts = stats.checkouts, stats.overflow_events, stats.timeouts
+
+    first, second = engine.connect(), engine.connect()
+    with pytest.raises(PoolTimeoutError):
+        engine.connect()
+    first.close()
+    second.close()
+    engine.connect().close()
+    engine.dispose()
+
+    assert stats.checkouts == checkouts + 3
+    assert stats.overflow_events == overflow_events + 1
+    assert stats.timeouts == timeouts + 1
@@ -0,0 +1,51 @@
+"""Drive every route with a query budget, with QUERY_BUDGET_ENFORCE on.
+
+Routes are found through the max_statements attribute query_budget sets,
+so a newly budgeted route is covered without editing this file. Each is
+requested with a cold and then a warm read cache; an overrun raises
+QueryBudgetExceeded out of the request.
+"""
+import model
+import pytest
+import server
+
+from datetime import datetime, timedelta
+
+# Pages catch read errors and render one of these instead of failing
+ERROR_MESSAGES = (b'Error loading events', b'Error loading day view', b'Error loading form', b'Error loading pets')
+
+BUDGETED = sorted({rule.endpoint for rule in server.app.url_map.iter_rules()
+                   if 'GET' in rule.methods
+                   and getattr(server.app.view_functions[rule.endpoint], 'max_statements', None) is not None})
+
+
+@pytest.fixture
+def history(household, add_event):
+    """A few days of every event type, so each read path returns rows."""
+    now = datetime.now(tz=model.APP_TIMEZONE)
+    pet = household['pets'][0]
+    for days_ago in range(3):
+        timestamp = now - timedelta(days=days_ago, hours=1)
+        add_event(model.EventType.Food, timestamp, {'pet': pet, 'food-name': 'Salmon Pate', 'food-type': 'wet',
+                                                    'food-amount': '1', 'food-unit': 'cans', 'food-calories': '170'})
+        add_event(model.EventType.Litter, timestamp, {})
+        add_event(model.EventType.Medicine, timestamp, {'pet': pet, 'medicine-name': 'Gabapentin',
+                                                        'medicine-dose': '50mg'})
+        add_event(model.EventType.Vitals, timestamp, {'pet': pet, 'vitals-weight': '4.5'})
+
+
+def test_budgeted_routes_found():
+    assert {'show_events', 'show_events_all', 'show_events_day', 'api_events_days', 'new_event',
+            'view_pets', 'api_pet_trends'} <= set(BUDGETED)
+
+
+@pytest.mark.parametrize('endpoint', BUDGETED)
+def test_route_within_query_budget(app, client, household, history, endpoint):
+    rule = next(rule for rule in app.url_map.iter_rules() if rule.endpoint == endpoint)
+    path = rule.rule.replace('<pet_uuid>', household['pets'][0])
+    assert not rule.arguments - {'pet_uuid'}, f'no test value for the arguments of {rule.rule}'
+
+    for cache_state in ('cold', 'warm'):
+        response = client.get(path)
+        assert response.status_code == 200, f'{cache_state}: {response.status_code}'
+        assert not any(message in response.data for message in ERROR_MESSAGES), cache_state
@@ -0,0 +1,93 @@
+"""Query plan regression tests for the event read paths.
+
+The plans are taken against a dataset seeded by bench/generate.py and
+ANALYZEd, with the planner at its default settings, so they are the plans
+production would get for a household with a year of history. A missing or
+unusable index shows up as a plan without it, or with a Sort node.
+"""
+import os
+import random
+import sys
+
+import events
+import model
+import pytest
+import rollups
+import trends
+
+from datetime import date, datetime, timedelta
+from sqlalchemy import text
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'bench'))
+
+import generate  # noqa: E402
+
+HOUSEHOLDS = 100
+YEARS = 1
+
+
+@pytest.fixture(scope='module')
+def seeded(app) -> dict:
+    """A seeded dataset of HOUSEHOLDS households; returns the first one."""
+    rng = random.Random(1)
+    with app.app_context():
+        households = generate._households(HOUSEHOLDS, 2, rng)
+        generate._load_reference_rows(households)
+        generate._load_events(households, YEARS, 30, rng)
+        rollups.rebuild()
+        model.db.session.execute(text('ANALYZE'))
+        model.db.session.commit()
+    return households[0]
+
+
+def _plan(query) -> str:
+    """EXPLAIN a query and return the plan text."""
+    sql = query.compile(dialect=model.db.engine.dialect, compile_kwargs={'literal_binds': True})
+    return '\n'.join(model.db.session.execute(text(f'EXPLAIN {sql}')).scalars())
+
+
+def test_event_page_uses_household_timestamp_index(app, seeded):
+    with app.app_context():
+        plan = _plan(events.page_query(seeded['uuid'], None, events.PAGE_SIZE))
+        first_page = model.db.session.execute(events.page_query(seeded['uuid'], None, events.PAGE_SIZE)).all()
+        _, cursor = events.page_rows(first_page, events.PAGE_SIZE)
+        cursor_plan = _plan(events.page_query(seeded['uuid'], cursor, events.PAGE_SIZE))
+
+    for query_plan in (plan, cursor_plan):
+        assert 'ix_event_household_uuid_timestamp' in query_plan
+        assert 'Sort' not in query_plan
+
+
+def test_event_page_joins_metadata_by_event_id_index(app, seeded):
+    with app.app_context():
+        plan = _plan(events.page_query(seeded['uuid'], None, events.PAGE_SIZE))
+
+    for index in ('ix_food_event_event_id', 'ix_medicine_event_event_id', 'ix_vitals_event_event_id'):
+        assert index in plan
+
+
+def test_pet_weight_series_uses_type_pet_index(app, seeded):
+    today = date.today()
+    with app.app_context():
+        plan = _plan(trends._weight_series(seeded['uuid'], seeded['pets'][0]['uuid'], 'day', 7,
+                                           today - timedelta(days=90), today))
+
+    assert 'ix_event_household_uuid_type_pet_uuid_timestamp' in plan
+    assert 'ix_vitals_event_event_id' in plan
+
+
+def test_summary_reads_latest_event_index(app, seeded):
+    with app.app_context():
+        plan = _plan(events.summary_query(seeded['uuid']))
+
+    assert 'ix_latest_event_household_uuid_type_pet_uuid' in plan
+    assert 'ix_event_household_uuid_timestamp' not in plan
+
+
+def test_days_view_reads_rollup_index(app, seeded):
+    start = datetime.now(tz=model.APP_TIMEZONE)
+    with app.app_context():
+        plan = _plan(rollups.totals_query(seeded['uuid'], *events.days_range(seeded['uuid'], start, 10)))
+
+    assert 'ix_daily_pet_rollup_household_uuid_day_pet_uuid_type' in plan
+    assert 'on event ' not in plan
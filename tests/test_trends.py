@@ -0,0 +1,37 @@
+"""Tests for the per-pet trends API."""
+import model
+
+from datetime import date, datetime
+
+
+def _at(day: date, hour: int) -> datetime:
+    return model.APP_TIMEZONE.localize(datetime(day.year, day.month, day.day, hour))
+
+
+def test_weight_event_appears_in_its_pets_trends(client, household, add_event):
+    weighed, other = household['pets']
+    add_event(model.EventType.Vitals, _at(date(2026, 3, 2), 8), {'pet': weighed, 'vitals-weight': '4.5'})
+    add_event(model.EventType.Vitals, _at(date(2026, 3, 4), 8), {'pet': weighed, 'vitals-weight': '4.7'})
+
+    response = client.get(f'/api/pets/{weighed}/trends?start=2026-03-01&end=2026-03-07')
+    assert response.status_code == 200
+    assert response.get_json()['weight'] == [
+        {'bucket': '2026-03-02', 'value': 4.5, 'rolling_avg': 4.5, 'change_per_day': None},
+        {'bucket': '2026-03-04', 'value': 4.7, 'rolling_avg': 4.6, 'change_per_day': 0.1},
+    ]
+
+    response = client.get(f'/api/pets/{other}/trends?start=2026-03-01&end=2026-03-07')
+    assert response.get_json()['weight'] == []
+
+
+def test_food_event_appears_in_its_pets_calorie_trends(client, household, add_event):
+    pet = household['pets'][0]
+    add_event(model.EventType.Food, _at(date(2026, 3, 2), 8),
+              {'pet': pet, 'food-name': 'Salmon Pate', 'food-type': 'wet', 'food-amount': '1',
+               'food-unit': 'cans', 'food-calories': '170'})
+
+    response = client.get(f'/api/pets/{pet}/trends?start=2026-03-01&end=2026-03-03')
+    assert response.status_code == 200
+    assert [(bucket['bucket'], bucket['total']) for bucket in response.get_json()['calories']] == [
+        ('2026-03-01', 0), ('2026-03-02', 170), ('2026-03-03', 0),
+    ]
@@ -0,0 +1,17 @@
+"""Tests for conditional GET."""
+import versions
+
+
+def test_new_release_invalidates_etags(app, client, monkeypatch):
+    response = client.get('/api/events/summary')
+    etag = response.headers['ETag']
+    assert client.get('/api/events/summary', headers={'If-None-Match': etag}).status_code == 304
+
+    monkeypatch.setitem(app.config, 'RELEASE', 'next-release')
+    versions.release.cache_clear()
+    try:
+        response = client.get('/api/events/summary', headers={'If-None-Match': etag})
+    finally:
+        versions.release.cache_clear()
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag